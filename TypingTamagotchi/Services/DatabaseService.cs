@@ -1,6 +1,7 @@
 using System;
 using System.Collections.Generic;
 using System.IO;
+using Avalonia.Platform;
 using Microsoft.Data.Sqlite;
 using TypingTamagotchi.Models;
 
@@ -8,6 +9,12 @@ namespace TypingTamagotchi.Services;
 
 public class DatabaseService
 {
+    // scripts/compile_catalog.py 가 creature_catalog.json 으로 만든 크리처 시드 DB
+    private const string SeedDatabaseUri = "avares://TypingTamagotchi/Assets/creatures_seed.db";
+
+    // 시드 DB의 크리처 수 (compile_catalog.py가 PRAGMA user_version에 기록, 헤더만 읽어서 확인)
+    private static readonly Lazy<int> SeedCreatureCount = new(ReadSeedCreatureCount);
+
     private readonly string _connectionString;
     private static readonly string AppDataFolder = Path.Combine(
         Environment.GetFolderPath(Environment.SpecialFolder.LocalApplicationData),
@@ -22,6 +29,11 @@ public class DatabaseService
             Directory.CreateDirectory(AppDataFolder);
             dbPath = Path.Combine(AppDataFolder, "tamagotchi.db");
         }
+        // 첫 실행: 크리처가 미리 채워진 시드 DB를 그대로 복사
+        if (!File.Exists(dbPath))
+        {
+            CreateDatabaseFromSeed(dbPath);
+        }
         _connectionString = $"Data Source={dbPath}";
         Console.WriteLine($"[DB] Path: {dbPath}");
         InitializeDatabase();
@@ -297,253 +309,118 @@ public class DatabaseService
 
         if (count > 0) return;
 
-        // 50종 크리처 데이터 (name, rarity, element, desc, age, gender, food, dislikes, background)
-        var creatures = new List<(string name, Rarity rarity, Element element, string desc, string age, string gender, string food, string dislikes, string background)>
+        CopyCreaturesFromSeed(connection);
+    }
+
+    /// <summary>
+    /// 앱에 포함된 시드 DB를 파일로 풀기 (실패 시 불완전한 파일은 삭제)
+    /// </summary>
+    private static bool ExtractSeedDatabase(string path)
+    {
+        try
         {
-            // Common (25종) - ID 1~25
-            ("슬라임", Rarity.Common, Element.Water, "말랑말랑한 젤리 생물",
-                "3살", "무성", "설탕물", "건조한 날씨",
-                "숲속 연못가에서 자연발생한 슬라임. 비 오는 날을 좋아하며, 항상 촉촉하게 유지하려고 노력한다."),
-
-            ("꼬마구름", Rarity.Common, Element.Wind, "둥실둥실 떠다니는 구름",
-                "1살", "무성", "수증기", "강한 바람",
-                "맑은 날 하늘에서 태어난 작은 구름. 혼자 떠다니다가 외로워서 땅으로 내려왔다."),
-
-            ("잎새", Rarity.Common, Element.Earth, "바람에 흔들리는 잎사귀",
-                "1살", "여자", "햇빛", "가을",
-                "봄에 태어난 새싹이 의지를 갖게 되었다. 광합성으로 에너지를 얻으며 항상 밝은 성격이다."),
-
-            ("물방울", Rarity.Common, Element.Water, "투명하게 빛나는 물방울",
-                "1살", "무성", "이슬", "더운 날",
-                "아침 이슬에서 태어나 매일 새롭게 다시 태어난다. 순수하고 깨끗한 마음을 가졌다."),
-
-            ("돌멩이", Rarity.Common, Element.Earth, "단단한 작은 돌",
-                "100살", "남자", "미네랄", "물",
-                "산에서 굴러온 오래된 돌. 과묵하지만 든든하고 믿음직한 성격이다."),
-
-            ("별똥별", Rarity.Common, Element.Fire, "하늘에서 떨어진 작은 별",
-                "???", "무성", "우주먼지", "어둠",
-                "밤하늘에서 떨어진 별의 조각. 아직도 희미하게 빛나며 소원을 들어준다는 전설이 있다."),
-
-            ("꽃잎", Rarity.Common, Element.Earth, "향기로운 분홍 꽃잎",
-                "1살", "여자", "꿀", "벌레",
-                "정원에서 가장 예쁜 꽃에서 떨어진 꽃잎. 향기로 친구들을 기분 좋게 해준다."),
-
-            ("솜뭉치", Rarity.Common, Element.Wind, "폭신폭신한 솜",
-                "2살", "여자", "목화씨", "불",
-                "목화밭에서 태어난 솜뭉치. 누구든 안아주면 기분이 좋아지는 마법을 가졌다."),
-
-            ("젤리콩", Rarity.Common, Element.Lightning, "달콤한 젤리 콩",
-                "1살", "남자", "과일즙", "쓴맛",
-                "사탕가게에서 마법이 깃들어 살아난 젤리. 달콤한 농담으로 모두를 웃게 만든다."),
-
-            ("이끼돌", Rarity.Common, Element.Earth, "이끼가 낀 귀여운 돌",
-                "50살", "남자", "빗물", "건조함",
-                "숲속 개울가에서 오래 살아온 돌. 이끼와 공생하며 자연의 지혜를 간직하고 있다."),
-
-            ("눈송이", Rarity.Common, Element.Water, "차가운 눈 결정",
-                "1살", "무성", "찬공기", "봄",
-                "겨울 첫눈에서 태어난 눈 결정. 녹지 않는 마법으로 사계절 친구들과 함께한다."),
-
-            ("반딧불", Rarity.Common, Element.Fire, "밤에 빛나는 벌레",
-                "1살", "남자", "이슬", "낮",
-                "여름밤 풀숲에서 태어났다. 어두운 곳을 밝히는 것이 사명이라고 생각한다."),
-
-            ("씨앗", Rarity.Common, Element.Earth, "가능성이 담긴 씨앗",
-                "???", "무성", "물", "콘크리트",
-                "어떤 나무가 될지 아직 모르는 씨앗. 무한한 가능성을 품고 미래를 꿈꾼다."),
-
-            ("조약돌", Rarity.Common, Element.Earth, "강에서 온 매끈한 돌",
-                "200살", "무성", "강물", "높은곳",
-                "오랜 시간 강물에 씻겨 둥글어졌다. 인내심이 강하고 차분한 성격이다."),
-
-            ("먼지토끼", Rarity.Common, Element.Wind, "뽀송뽀송한 먼지 덩어리",
-                "1살", "여자", "먼지", "청소기",
-                "침대 밑에서 태어난 먼지 덩어리. 수줍음이 많아 구석에 숨어 지낸다."),
-
-            ("비누방울", Rarity.Common, Element.Water, "무지개빛 비누방울",
-                "1살", "무성", "비눗물", "바늘",
-                "아이의 웃음에서 태어난 비눗물. 터지지 않는 특별한 방울이 되어 영원히 날아다닌다."),
-
-            ("도토리", Rarity.Common, Element.Earth, "다람쥐가 좋아하는 열매",
-                "1살", "남자", "흙", "다람쥐",
-                "참나무에서 떨어진 도토리. 언젠가 큰 나무가 되겠다는 꿈을 품고 있다."),
-
-            ("꿀방울", Rarity.Common, Element.Fire, "달콤한 황금 방울",
-                "1살", "무성", "꽃꿀", "개미",
-                "꿀벌이 정성껏 만든 꿀 한 방울. 달콤함으로 지친 이들을 위로한다."),
-
-            ("깃털", Rarity.Common, Element.Wind, "가벼운 새 깃털",
-                "1살", "여자", "바람", "비",
-                "파랑새가 선물한 깃털. 가볍게 날아다니며 행운을 전해준다."),
-
-            ("이슬", Rarity.Common, Element.Water, "아침에 맺힌 이슬",
-                "1살", "무성", "안개", "정오",
-                "새벽에 풀잎 위에 맺힌 이슬. 순수함의 상징으로 치유의 능력이 있다."),
-
-            ("모래알", Rarity.Common, Element.Earth, "해변의 작은 모래",
-                "1000살", "무성", "파도", "시멘트",
-                "오래전 조개껍데기였던 모래. 바다의 추억을 간직하고 있다."),
-
-            ("풀잎", Rarity.Common, Element.Earth, "초록빛 풀잎",
-                "1살", "남자", "이슬", "제초제",
-                "들판에서 가장 씩씩하게 자란 풀. 작지만 강인한 생명력을 자랑한다."),
-
-            ("나뭇가지", Rarity.Common, Element.Earth, "작은 나무 조각",
-                "5살", "남자", "빗물", "도끼",
-                "큰 나무에서 떨어진 작은 가지. 언젠가 다시 뿌리내리겠다는 희망을 품고 있다."),
-
-            ("진흙이", Rarity.Common, Element.Earth, "말랑한 진흙 덩어리",
-                "???", "무성", "빗물", "가뭄",
-                "비 온 뒤 웅덩이에서 태어났다. 어떤 모양이든 될 수 있는 무한한 가능성의 존재다."),
-
-            ("버섯", Rarity.Common, Element.Earth, "동글동글한 버섯",
-                "1살", "남자", "습기", "햇빛",
-                "숲속 그늘에서 자란 버섯. 수줍음이 많지만 친구들에게는 따뜻한 존재다."),
-
-            // Rare (15종) - ID 26~40
-            ("번개토끼", Rarity.Rare, Element.Lightning, "전기를 품은 토끼",
-                "2살", "남자", "당근", "물",
-                "폭풍우 치는 밤에 번개를 맞고 태어났다. 빠른 속도와 전기 능력을 가졌다."),
-
-            ("불꽃여우", Rarity.Rare, Element.Fire, "꼬리에서 불꽃이 피는 여우",
-                "5살", "여자", "고구마", "비",
-                "화산 근처에서 태어난 여우. 따뜻한 마음씨로 추운 겨울에 친구들을 따뜻하게 해준다."),
-
-            ("얼음펭귄", Rarity.Rare, Element.Water, "차가운 기운의 펭귄",
-                "4살", "남자", "생선", "더위",
-                "남극에서 온 펭귄. 어디서든 시원한 환경을 만들어내며 여름에 인기가 많다."),
-
-            ("바람새", Rarity.Rare, Element.Wind, "바람을 타고 나는 새",
-                "3살", "여자", "씨앗", "새장",
-                "산꼭대기에서 태어난 새. 자유로운 영혼으로 바람과 대화할 수 있다."),
-
-            ("꽃사슴", Rarity.Rare, Element.Earth, "뿔에 꽃이 피는 사슴",
-                "7살", "여자", "과일", "겨울",
-                "봄의 정원에서 태어났다. 지나가는 곳마다 꽃이 피어나는 능력이 있다."),
-
-            ("달토끼", Rarity.Rare, Element.Lightning, "달빛을 받으면 빛나는 토끼",
-                "100살", "여자", "떡", "구름",
-                "달에서 내려온 전설의 토끼. 보름달이 뜨면 특별한 힘이 생긴다."),
-
-            ("무지개뱀", Rarity.Rare, Element.Lightning, "일곱 색깔 비늘의 뱀",
-                "8살", "무성", "과일", "어둠",
-                "비 갠 뒤 무지개 아래에서 태어났다. 비늘 색깔로 감정을 표현한다."),
-
-            ("구름고래", Rarity.Rare, Element.Water, "하늘을 헤엄치는 고래",
-                "50살", "남자", "비구름", "번개",
-                "하늘 높이 떠다니는 신비한 고래. 비를 내려주며 대지를 적셔준다."),
-
-            ("수정나비", Rarity.Rare, Element.Lightning, "투명한 날개의 나비",
-                "1살", "여자", "꽃꿀", "먼지",
-                "수정동굴에서 태어난 나비. 날개에서 빛이 굴절되어 무지개가 생긴다."),
-
-            ("숲요정", Rarity.Rare, Element.Earth, "숲을 지키는 작은 요정",
-                "300살", "여자", "이슬", "오염",
-                "고대 숲에서 태어난 요정. 작지만 숲의 모든 생명을 보살피는 수호자다."),
-
-            ("별똥곰", Rarity.Rare, Element.Lightning, "별빛 털을 가진 곰",
-                "10살", "남자", "꿀", "시끄러움",
-                "유성우가 쏟아지던 밤에 태어났다. 털에서 은은한 별빛이 난다."),
-
-            ("파도물개", Rarity.Rare, Element.Water, "파도를 타는 물개",
-                "6살", "남자", "조개", "기름",
-                "깊은 바다에서 온 물개. 파도를 자유자재로 다루며 서핑의 달인이다."),
-
-            ("안개늑대", Rarity.Rare, Element.Wind, "안개 속에서 나타나는 늑대",
-                "15살", "남자", "고기", "강한빛",
-                "깊은 산 안개 속에서 태어났다. 신비로운 분위기를 풍기지만 사실 친근하다."),
-
-            ("노을새", Rarity.Rare, Element.Fire, "저녁노을 빛깔의 새",
-                "4살", "여자", "열매", "밤",
-                "해질녘에만 나타나는 새. 노을의 아름다움을 품고 있어 보는 이를 감동시킨다."),
-
-            ("이끼거북", Rarity.Rare, Element.Earth, "등에 정원이 있는 거북",
-                "500살", "남자", "채소", "서두름",
-                "천년을 살아온 거북. 등에는 작은 생태계가 있어 많은 생물이 살고 있다."),
-
-            // Epic (7종) - ID 41~47
-            ("용아기", Rarity.Epic, Element.Fire, "아직 어린 용",
-                "50살", "남자", "보석", "물",
-                "화산 깊은 곳에서 태어난 아기 용. 아직 어리지만 언젠가 위대한 용이 될 것이다."),
-
-            ("유니콘", Rarity.Epic, Element.Lightning, "무지개 갈기의 유니콘",
-                "200살", "여자", "황금사과", "거짓말",
-                "순수한 마음을 가진 자에게만 보이는 전설의 말. 뿔에는 치유의 힘이 있다."),
-
-            ("피닉스", Rarity.Epic, Element.Fire, "불꽃에서 다시 태어나는 새",
-                "999살", "무성", "태양열", "어둠",
-                "불멸의 새. 재가 되어도 다시 태어나며, 눈물은 모든 상처를 치유한다."),
-
-            ("크라켄", Rarity.Epic, Element.Water, "심해의 거대 문어",
-                "1000살", "남자", "배", "육지",
-                "심해에서 전설로만 전해지던 존재. 사실은 외로워서 친구를 찾고 있다."),
-
-            ("그리폰", Rarity.Epic, Element.Wind, "독수리와 사자의 합체",
-                "150살", "남자", "고기", "새장",
-                "하늘과 땅의 왕이 합쳐진 존재. 용맹하지만 정의로운 성격이다."),
-
-            ("켈피", Rarity.Epic, Element.Water, "물속의 신비한 말",
-                "???", "여자", "해초", "불",
-                "호수 깊은 곳에 사는 물의 정령. 아름답지만 신비로운 힘을 숨기고 있다."),
-
-            ("바실리스크", Rarity.Epic, Element.Earth, "눈빛이 무서운 뱀",
-                "800살", "남자", "돌", "거울",
-                "고대 유적에서 깨어난 뱀. 무서운 전설과 달리 사실은 수줍음이 많다."),
-
-            // Legendary (3종) - ID 48~50
-            ("황금드래곤", Rarity.Legendary, Element.Fire, "전설의 황금빛 용",
-                "10000살", "남자", "황금", "탐욕",
-                "태초부터 존재했던 전설의 용. 황금빛 비늘은 지혜와 영원을 상징한다. 세상의 균형을 지키는 수호자다."),
-
-            ("세계수정령", Rarity.Legendary, Element.Earth, "세계수를 지키는 정령",
-                "999살", "무성", "생명력", "파괴",
-                "세상 모든 생명의 근원인 세계수에서 태어났다. 자연의 모든 힘을 다룰 수 있으며, 생명을 창조하고 치유한다."),
-
-            ("시간고양이", Rarity.Legendary, Element.Lightning, "시간을 다루는 신비한 고양이",
-                "???", "여자", "별빛", "소음",
-                "시간의 틈새에서 태어난 고양이. 과거와 미래를 볼 수 있으며, 가끔 시간을 멈추고 낮잠을 잔다."),
-
-            // 추가 크리처 - ID 51~53
-            ("지우개똥", Rarity.Common, Element.Earth, "말랑말랑한 지우개 모양 생물",
-                "1살", "무성", "연필심", "볼펜",
-                "누군가의 실수를 지우다가 생명을 얻었다. 실수를 먹고 자라며, 항상 깨끗한 시작을 응원한다."),
-
-            ("네시", Rarity.Legendary, Element.Water, "스코틀랜드 호수의 전설",
-                "10000살", "여자", "물고기", "카메라",
-                "네스호 깊은 곳에 숨어 사는 전설의 공룡. 수줍음이 많아 사진 찍히는 걸 극도로 싫어한다."),
-
-            ("빅풋", Rarity.Legendary, Element.Earth, "숲속의 거대한 발자국 주인",
-                "???", "남자", "베리", "문명",
-                "깊은 산속에 사는 전설의 거인. 발자국만 남기고 사라지며, 사실은 매우 친절하고 수줍음이 많다."),
-
-            // 커스텀 크리처 - ID 54
-            ("렌고쿠", Rarity.Epic, Element.Fire, "불꽃을 다루는 염주",
-                "20살", "남자", "고구마", "나약함",
-                "마음을 불태워라! 타오르는 불꽃의 의지를 가진 검사. 언제나 웃으며 다른 이들을 지키고자 한다."),
-        };
-
-        var insertCommand = connection.CreateCommand();
-        insertCommand.CommandText = @"
-            INSERT INTO creatures (name, rarity, element, sprite_path, description, age, gender, favorite_food, dislikes, background)
-            VALUES (@name, @rarity, @element, @sprite, @desc, @age, @gender, @food, @dislikes, @background)
-        ";
+            using var seed = AssetLoader.Open(new Uri(SeedDatabaseUri));
+            using var file = File.Create(path);
+            seed.CopyTo(file);
+            return true;
+        }
+        catch (Exception ex)
+        {
+            Console.WriteLine($"[DB] Seed extract failed: {ex.Message}");
+            try { File.Delete(path); } catch { }
+            return false;
+        }
+    }
+
+    /// <summary>
+    /// 시드 DB를 임시 파일로 풀어서 준비한 뒤 제자리로 이동
+    /// (복사 중 종료돼도 잘린 tamagotchi.db가 남지 않음 - 다음 실행에서 다시 시도)
+    /// </summary>
+    private static void CreateDatabaseFromSeed(string dbPath)
+    {
+        var tmpPath = dbPath + ".tmp";
+        if (!ExtractSeedDatabase(tmpPath)) return;
+
+        try
+        {
+            // 시드의 user_version은 크리처 수라서 앱 DB에 스키마 버전처럼 남지 않도록 초기화
+            using (var connection = new SqliteConnection($"Data Source={tmpPath};Pooling=False"))
+            {
+                connection.Open();
+                var resetCommand = connection.CreateCommand();
+                resetCommand.CommandText = "PRAGMA user_version = 0";
+                resetCommand.ExecuteNonQuery();
+            }
+            File.Move(tmpPath, dbPath);
+        }
+        catch (Exception ex)
+        {
+            Console.WriteLine($"[DB] Seed install failed: {ex.Message}");
+            try { File.Delete(tmpPath); } catch { }
+        }
+    }
+
+    /// <summary>
+    /// 시드 DB 파일 헤더의 user_version (offset 60, big-endian) 읽기 - 파일로 풀거나 열지 않음
+    /// </summary>
+    private static int ReadSeedCreatureCount()
+    {
+        try
+        {
+            using var seed = AssetLoader.Open(new Uri(SeedDatabaseUri));
+            var header = new byte[64];
+            var read = 0;
+            while (read < header.Length)
+            {
+                var n = seed.Read(header, read, header.Length - read);
+                if (n == 0) return 0;
+                read += n;
+            }
+            return (header[60] << 24) | (header[61] << 16) | (header[62] << 8) | header[63];
+        }
+        catch (Exception ex)
+        {
+            Console.WriteLine($"[DB] Seed header read failed: {ex.Message}");
+            return 0;
+        }
+    }
+
+    /// <summary>
+    /// 시드 DB의 크리처 중 아직 없는 id만 복사 (추가된 개수 반환)
+    /// </summary>
+    private static int CopyCreaturesFromSeed(SqliteConnection connection)
+    {
+        var seedPath = Path.Combine(Path.GetTempPath(), $"TypingTamagotchi_seed_{Guid.NewGuid():N}.db");
+        if (!ExtractSeedDatabase(seedPath)) return 0;
 
-        for (int i = 0; i < creatures.Count; i++)
+        try
         {
-            var c = creatures[i];
-            insertCommand.Parameters.Clear();
-            insertCommand.Parameters.AddWithValue("@name", c.name);
-            insertCommand.Parameters.AddWithValue("@rarity", (int)c.rarity);
-            insertCommand.Parameters.AddWithValue("@element", (int)c.element);
-            insertCommand.Parameters.AddWithValue("@sprite", $"Creatures/{i + 1}.png");
-            insertCommand.Parameters.AddWithValue("@desc", c.desc);
-            insertCommand.Parameters.AddWithValue("@age", c.age);
-            insertCommand.Parameters.AddWithValue("@gender", c.gender);
-            insertCommand.Parameters.AddWithValue("@food", c.food);
-            insertCommand.Parameters.AddWithValue("@dislikes", c.dislikes);
-            insertCommand.Parameters.AddWithValue("@background", c.background);
-            insertCommand.ExecuteNonQuery();
+            var attachCommand = connection.CreateCommand();
+            attachCommand.CommandText = "ATTACH DATABASE @path AS seed";
+            attachCommand.Parameters.AddWithValue("@path", seedPath);
+            attachCommand.ExecuteNonQuery();
+
+            try
+            {
+                var copyCommand = connection.CreateCommand();
+                copyCommand.CommandText = @"
+                    INSERT OR IGNORE INTO creatures (id, name, rarity, element, sprite_path, description, age, gender, favorite_food, dislikes, background)
+                    SELECT id, name, rarity, element, sprite_path, description, age, gender, favorite_food, dislikes, background
+                    FROM seed.creatures
+                ";
+                return copyCommand.ExecuteNonQuery();
+            }
+            finally
+            {
+                // 풀링된 커넥션에 ATTACH가 남지 않도록
+                var detachCommand = connection.CreateCommand();
+                detachCommand.CommandText = "DETACH DATABASE seed";
+                detachCommand.ExecuteNonQuery();
+            }
+        }
+        finally
+        {
+            try { File.Delete(seedPath); } catch { }
         }
     }
 
@@ -572,86 +449,33 @@ public class DatabaseService
     }
 
     /// <summary>
-    /// 기존 DB에 새로 추가된 크리처를 마이그레이션
+    /// 기존 DB에 새로 추가된 크리처를 마이그레이션 (시드 DB에만 있는 id 추가)
     /// </summary>
     public void MigrateNewCreatures()
     {
         using var connection = GetConnection();
 
-        // 현재 크리처 수 확인
+        // 대부분의 실행은 이미 최신: 개수만 비교하고 시드 DB는 빠진 크리처가 있을 때만 풀기
+        // (id는 1부터 빈틈 없음 - compile_catalog.py 검증)
         var countCommand = connection.CreateCommand();
         countCommand.CommandText = "SELECT COUNT(*) FROM creatures";
         var count = Convert.ToInt32(countCommand.ExecuteScalar());
+        if (count >= SeedCreatureCount.Value) return;
 
-        // 54종 추가 (렌고쿠) + 용민이의 선물로 자동 지급
-        if (count == 53)
-        {
-            var insertCommand = connection.CreateCommand();
-            insertCommand.CommandText = @"
-                INSERT INTO creatures (id, name, rarity, element, sprite_path, description, age, gender, favorite_food, dislikes, background)
-                VALUES (54, '렌고쿠', @rarity, @element, 'Creatures/54.png', '불꽃을 다루는 염주',
-                        '20살', '남자', '고구마', '나약함',
-                        '마음을 불태워라! 타오르는 불꽃의 의지를 가진 검사. 언제나 웃으며 다른 이들을 지키고자 한다.')
-            ";
-            insertCommand.Parameters.AddWithValue("@rarity", (int)Rarity.Epic);
-            insertCommand.Parameters.AddWithValue("@element", (int)Element.Fire);
-            insertCommand.ExecuteNonQuery();
-
-            // 용민이의 선물: 렌고쿠를 모든 유저 컬렉션에 자동 추가!
-            var giftCommand = connection.CreateCommand();
-            giftCommand.CommandText = @"
-                INSERT OR IGNORE INTO collection (creature_id, obtained_at)
-                VALUES (54, @now)
-            ";
-            giftCommand.Parameters.AddWithValue("@now", DateTime.Now.ToString("o"));
-            giftCommand.ExecuteNonQuery();
-
-            count = 54;
-        }
-
-        // 이미 54종이면 마이그레이션 불필요
-        if (count >= 54) return;
-
-        // 50종만 있으면 51-53 추가
-        if (count == 50)
-        {
-            var newCreatures = new List<(int id, string name, Rarity rarity, Element element, string desc, string age, string gender, string food, string dislikes, string background)>
-            {
-                (51, "지우개똥", Rarity.Common, Element.Earth, "말랑말랑한 지우개 모양 생물",
-                    "1살", "무성", "연필심", "볼펜",
-                    "누군가의 실수를 지우다가 생명을 얻었다. 실수를 먹고 자라며, 항상 깨끗한 시작을 응원한다."),
-
-                (52, "네시", Rarity.Legendary, Element.Water, "스코틀랜드 호수의 전설",
-                    "10000살", "여자", "물고기", "카메라",
-                    "네스호 깊은 곳에 숨어 사는 전설의 공룡. 수줍음이 많아 사진 찍히는 걸 극도로 싫어한다."),
-
-                (53, "빅풋", Rarity.Legendary, Element.Earth, "숲속의 거대한 발자국 주인",
-                    "???", "남자", "베리", "문명",
-                    "깊은 산속에 사는 전설의 거인. 발자국만 남기고 사라지며, 사실은 매우 친절하고 수줍음이 많다."),
-            };
+        // 렌고쿠(54)가 이번에 새로 추가되는지 확인
+        var checkCommand = connection.CreateCommand();
+        checkCommand.CommandText = "SELECT COUNT(*) FROM creatures WHERE id = 54";
+        var hadRengoku = Convert.ToInt32(checkCommand.ExecuteScalar()) > 0;
 
-            var insertCommand = connection.CreateCommand();
-            insertCommand.CommandText = @"
-                INSERT INTO creatures (id, name, rarity, element, sprite_path, description, age, gender, favorite_food, dislikes, background)
-                VALUES (@id, @name, @rarity, @element, @sprite, @desc, @age, @gender, @food, @dislikes, @background)
-            ";
+        if (CopyCreaturesFromSeed(connection) == 0 || hadRengoku) return;
 
-            foreach (var c in newCreatures)
-            {
-                insertCommand.Parameters.Clear();
-                insertCommand.Parameters.AddWithValue("@id", c.id);
-                insertCommand.Parameters.AddWithValue("@name", c.name);
-                insertCommand.Parameters.AddWithValue("@rarity", (int)c.rarity);
-                insertCommand.Parameters.AddWithValue("@element", (int)c.element);
-                insertCommand.Parameters.AddWithValue("@sprite", $"Creatures/{c.id}.png");
-                insertCommand.Parameters.AddWithValue("@desc", c.desc);
-                insertCommand.Parameters.AddWithValue("@age", c.age);
-                insertCommand.Parameters.AddWithValue("@gender", c.gender);
-                insertCommand.Parameters.AddWithValue("@food", c.food);
-                insertCommand.Parameters.AddWithValue("@dislikes", c.dislikes);
-                insertCommand.Parameters.AddWithValue("@background", c.background);
-                insertCommand.ExecuteNonQuery();
-            }
-        }
+        // 용민이의 선물: 렌고쿠를 모든 유저 컬렉션에 자동 추가!
+        var giftCommand = connection.CreateCommand();
+        giftCommand.CommandText = @"
+            INSERT OR IGNORE INTO collection (creature_id, obtained_at)
+            VALUES (54, @now)
+        ";
+        giftCommand.Parameters.AddWithValue("@now", DateTime.Now.ToString("o"));
+        giftCommand.ExecuteNonQuery();
     }
 }
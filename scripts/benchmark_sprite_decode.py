@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+PNG vs .tcsb 로드 시간 / 파일 크기 비교
+Assets/ 원본 이미지 폴더(SOURCE_DIRS)의 PNG 대상
+
+    cold  첫 로드: 페이지 캐시에서 파일을 내보낸 뒤 디스크 읽기 + 디코드 1회
+          (.tcsb가 PNG보다 크므로 읽기 시간까지 포함해야 실제 앱 시작 비용과 같음)
+    warm  바이트를 메모리에 올려둔 상태에서 디코드만, 반복 중 최소
+
+캐시 내보내기는 posix_fadvise(DONTNEED)가 있는 OS(Linux)에서만 동작하고,
+없으면 cold 값은 OS 캐시에 남은 파일의 첫 읽기 시간임
+.tcsb는 encode_sprite_blobs.py와 같은 위치(scripts/sprite_blobs/)에 새로 써서 측정
+
+사용법: python benchmark_sprite_decode.py [반복횟수]
+"""
+
+import io
+import os
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+from encode_sprite_blobs import ASSETS_DIR, SOURCE_DIRS, collect_pngs, encode, decode, blob_path_for
+
+DEFAULT_REPEAT = 5
+
+
+def decode_png(data: bytes) -> np.ndarray:
+    """PNG 바이트 → RGBA 픽셀 (앱의 new Bitmap(stream)과 같은 단계: inflate + 언필터 + RGBA 변환)"""
+    with Image.open(io.BytesIO(data)) as img:
+        return np.asarray(img.convert("RGBA"))
+
+
+def evict_cache(path: Path) -> bool:
+    """파일을 OS 페이지 캐시에서 내보내기 (지원하지 않으면 False)"""
+    if not hasattr(os, "posix_fadvise"):
+        return False
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)  # 방금 쓴 파일은 dirty 페이지라 먼저 디스크에 써야 내보낼 수 있음
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    finally:
+        os.close(fd)
+    return True
+
+
+def cold_time(func, path: Path) -> float:
+    """캐시를 비운 파일을 읽어서 디코드하는 첫 로드 시간 (초)"""
+    evict_cache(path)
+    start = time.perf_counter()
+    func(path.read_bytes())
+    return time.perf_counter() - start
+
+
+def best_time(func, data: bytes, repeat: int) -> float:
+    """repeat번 실행 중 최소 시간 (초)"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(data)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_REPEAT
+    png_paths = collect_pngs(SOURCE_DIRS)
+
+    if not png_paths:
+        print(f"PNG 없음: {ASSETS_DIR}")
+        return
+
+    cache_note = "캐시 비움" if hasattr(os, "posix_fadvise") else "캐시 비우기 미지원"
+    print(f"=== 로드 벤치마크 ({len(png_paths)}개, cold 1회 ({cache_note}) / warm 반복 {repeat}회 중 최소) ===\n")
+    print(f"{'파일':<40} {'크기':>9} {'PNG KB':>8} {'TCSB KB':>8} "
+          f"{'PNG cold':>9} {'TCSB cold':>9} {'PNG warm':>9} {'TCSB warm':>9}")
+
+    total_png_size = total_blob_size = 0
+    totals = {"png_cold": 0.0, "blob_cold": 0.0, "png_warm": 0.0, "blob_warm": 0.0}
+
+    for png_path in png_paths:
+        blob = encode(png_path)
+        blob_path = blob_path_for(png_path)
+        blob_path.parent.mkdir(parents=True, exist_ok=True)
+        blob_path.write_bytes(blob)
+
+        # cold를 먼저 측정 (warm 측정이 파일을 다시 캐시에 올리기 전에)
+        times = {
+            "png_cold": cold_time(decode_png, png_path),
+            "blob_cold": cold_time(decode, blob_path),
+        }
+        png_bytes = png_path.read_bytes()
+        times["png_warm"] = best_time(decode_png, png_bytes, repeat)
+        times["blob_warm"] = best_time(decode, blob, repeat)
+        height, width = decode(blob).shape[:2]
+
+        total_png_size += len(png_bytes)
+        total_blob_size += len(blob)
+        for key, value in times.items():
+            totals[key] += value
+
+        name = str(png_path.relative_to(ASSETS_DIR))
+        print(
+            f"{name:<40} {f'{width}x{height}':>9} "
+            f"{len(png_bytes) / 1024:>8.1f} {len(blob) / 1024:>8.1f} "
+            f"{times['png_cold'] * 1000:>9.2f} {times['blob_cold'] * 1000:>9.2f} "
+            f"{times['png_warm'] * 1000:>9.2f} {times['blob_warm'] * 1000:>9.2f}"
+        )
+
+    print("\n" + "=" * 50)
+    print(f"크기: PNG {total_png_size / 1024 / 1024:.2f} MB / TCSB {total_blob_size / 1024 / 1024:.2f} MB "
+          f"({total_blob_size / total_png_size:.2f}x)")
+    print(f"cold (읽기 + 디코드): PNG {totals['png_cold'] * 1000:.1f} ms / TCSB {totals['blob_cold'] * 1000:.1f} ms "
+          f"({totals['png_cold'] / totals['blob_cold']:.1f}x)")
+    print(f"warm (디코드만): PNG {totals['png_warm'] * 1000:.1f} ms / TCSB {totals['blob_warm'] * 1000:.1f} ms "
+          f"({totals['png_warm'] / totals['blob_warm']:.1f}x)")
+    print("=" * 50)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+이미지 플레이스홀더 인덱스 생성 (Assets/placeholders.json)
+크리처/알/UI 이미지마다 픽셀 디코드 없이 카드 레이아웃과 임시 배경을 그릴 수 있는 정보를 미리 계산
+
+    width, height  원본 크기
+    hash           파일 내용 해시 (ImageCacheService 캐시 무효화 키로도 사용)
+    average        평균 색 (알파 가중)
+    dominant       가장 많이 쓰인 색 (불투명 픽셀 기준, 채널당 4비트 양자화)
+    blurhash       BlurHash 문자열 (투명 영역은 BACKGROUND 위에 합성)
+    bbox           알파 기준 실제 내용 영역 [x, y, w, h] (완전 투명이면 null)
+
+색/BlurHash는 전체 이미지를 SAMPLE_SIZE로 줄여 한 배열에 쌓은 뒤 한 번에 계산
+"""
+
+import json
+import hashlib
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+# 경로 설정
+ASSETS_DIR = Path(__file__).parent.parent / "TypingTamagotchi" / "Assets"
+OUTPUT_PATH = ASSETS_DIR / "placeholders.json"
+
+# 대상 폴더 (썸네일은 원본과 같은 정보라 제외)
+SOURCE_DIRS = ["Creatures", "Eggs", "UI"]
+
+SAMPLE_SIZE = 32
+BLURHASH_COMPONENTS = (4, 3)   # (x, y)
+BACKGROUND = (255, 255, 255)   # 도감 카드 배경
+ALPHA_THRESHOLD = 8            # rembg 잔여 노이즈 무시
+DOMINANT_ALPHA = 128
+
+BASE83 = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz#$%*+,-.:;=?@[]^_{|}~"
+
+
+def collect_images() -> list[Path]:
+    paths = []
+    for name in SOURCE_DIRS:
+        paths += sorted(p for p in (ASSETS_DIR / name).glob("*.png"))
+    return paths
+
+
+def alpha_bbox(alpha: np.ndarray, threshold: int = ALPHA_THRESHOLD) -> tuple[int, int, int, int] | None:
+    """알파 채널 (H, W)에서 threshold 초과 픽셀을 모두 포함하는 [x, y, w, h]"""
+    mask = alpha > threshold
+    rows = np.flatnonzero(mask.any(axis=1))
+    if rows.size == 0:
+        return None
+    cols = np.flatnonzero(mask.any(axis=0))
+    return int(cols[0]), int(rows[0]), int(cols[-1] - cols[0] + 1), int(rows[-1] - rows[0] + 1)
+
+
+def to_hex(rgb) -> str:
+    return "#{:02x}{:02x}{:02x}".format(*(int(round(c)) for c in rgb))
+
+
+# === BlurHash ===
+
+def srgb_to_linear(values: np.ndarray) -> np.ndarray:
+    v = values / 255.0
+    return np.where(v <= 0.04045, v / 12.92, ((v + 0.055) / 1.055) ** 2.4)
+
+
+def linear_to_srgb(value: float) -> int:
+    v = min(max(value, 0.0), 1.0)
+    if v <= 0.0031308:
+        return int(v * 12.92 * 255 + 0.5)
+    return int((1.055 * v ** (1 / 2.4) - 0.055) * 255 + 0.5)
+
+
+def base83(value: int, length: int) -> str:
+    return "".join(BASE83[(value // 83 ** (length - i - 1)) % 83] for i in range(length))
+
+
+def blurhash_factors(linear: np.ndarray, components: tuple[int, int]) -> np.ndarray:
+    """(N, S, S, 3) 선형 RGB → (N, cy, cx, 3) DCT 계수"""
+    nx, ny = components
+    size = linear.shape[1]
+    pos = np.arange(size) / size * np.pi
+    basis_x = np.cos(np.outer(np.arange(nx), pos))
+    basis_y = np.cos(np.outer(np.arange(ny), pos))
+    factors = np.einsum("nyxc,jy,ix->njic", linear, basis_y, basis_x) / (size * size)
+
+    norm = np.full((ny, nx), 2.0)
+    norm[0, 0] = 1.0
+    return factors * norm[None, :, :, None]
+
+
+def encode_blurhash(factors: np.ndarray) -> str:
+    """(cy, cx, 3) 계수 → BlurHash 문자열"""
+    ny, nx = factors.shape[:2]
+    dc = factors[0, 0]
+    ac = factors.reshape(-1, 3)[1:]
+
+    result = base83((nx - 1) + (ny - 1) * 9, 1)
+    if ac.size:
+        quantised_max = int(max(0, min(82, np.floor(np.abs(ac).max() * 166 - 0.5))))
+        max_value = (quantised_max + 1) / 166
+        result += base83(quantised_max, 1)
+    else:
+        max_value = 1.0
+        result += base83(0, 1)
+
+    result += base83((linear_to_srgb(dc[0]) << 16) + (linear_to_srgb(dc[1]) << 8) + linear_to_srgb(dc[2]), 4)
+
+    scaled = np.sign(ac) * np.abs(ac / max_value) ** 0.5
+    quant = np.clip(np.floor(scaled * 9 + 9.5), 0, 18).astype(int)
+    for r, g, b in quant:
+        result += base83(r * 19 * 19 + g * 19 + b, 2)
+    return result
+
+
+# === 색상 ===
+
+def average_colors(samples: np.ndarray) -> np.ndarray:
+    """(N, S, S, 4) → 알파 가중 평균 RGB (N, 3)"""
+    alpha = samples[..., 3:4].astype(np.float64)
+    weight = alpha.sum(axis=(1, 2))
+    total = (samples[..., :3] * alpha).sum(axis=(1, 2))
+    return np.divide(total, weight, out=np.zeros_like(total), where=weight > 0)
+
+
+def dominant_colors(samples: np.ndarray) -> np.ndarray:
+    """(N, S, S, 4) → 불투명 픽셀 중 가장 많은 4비트 양자화 색 칸의 평균 RGB (N, 3)"""
+    n = samples.shape[0]
+    rgb = samples[..., :3].reshape(n, -1, 3).astype(np.int64)
+    opaque = samples[..., 3].reshape(n, -1) >= DOMINANT_ALPHA
+
+    q = rgb >> 4
+    bins = (q[..., 0] << 8) | (q[..., 1] << 4) | q[..., 2]
+    # 이미지별로 4096칸씩 떨어뜨려서 bincount 한 번으로 전체 히스토그램 계산
+    flat = (bins + np.arange(n)[:, None] * 4096)[opaque]
+    counts = np.bincount(flat, minlength=n * 4096).reshape(n, 4096)
+    sums = np.stack(
+        [np.bincount(flat, weights=rgb[..., c][opaque], minlength=n * 4096).reshape(n, 4096) for c in range(3)],
+        axis=-1,
+    )
+
+    best = counts.argmax(axis=1)
+    best_counts = counts[np.arange(n), best][:, None]
+    best_sums = sums[np.arange(n), best]
+    return np.divide(best_sums, best_counts, out=np.zeros_like(best_sums), where=best_counts > 0)
+
+
+def main():
+    paths = collect_images()
+    if not paths:
+        print(f"이미지 없음: {ASSETS_DIR}")
+        return
+
+    print(f"=== 플레이스홀더 인덱스 생성 ({len(paths)}개) ===\n")
+
+    entries = []
+    samples = []
+    for path in paths:
+        data = path.read_bytes()
+        with Image.open(path) as img:
+            rgba = img.convert("RGBA")
+            pixels = np.asarray(rgba)
+            sample = np.asarray(rgba.resize((SAMPLE_SIZE, SAMPLE_SIZE), Image.Resampling.BOX))
+
+        entries.append({
+            "key": path.relative_to(ASSETS_DIR).as_posix(),
+            "width": pixels.shape[1],
+            "height": pixels.shape[0],
+            "hash": hashlib.sha256(data).hexdigest()[:16],
+            "bbox": alpha_bbox(pixels[..., 3]),
+        })
+        samples.append(sample)
+
+    stack = np.stack(samples).astype(np.float64)
+    averages = average_colors(stack)
+    dominants = dominant_colors(stack)
+
+    # BlurHash는 알파가 없으므로 카드 배경 위에 합성
+    alpha = stack[..., 3:4] / 255.0
+    composited = stack[..., :3] * alpha + np.array(BACKGROUND, dtype=np.float64) * (1 - alpha)
+    factors = blurhash_factors(srgb_to_linear(composited), BLURHASH_COMPONENTS)
+
+    index = {}
+    for entry, average, dominant, factor in zip(entries, averages, dominants, factors):
+        key = entry.pop("key")
+        bbox = entry.pop("bbox")
+        index[key] = {
+            **entry,
+            "average": to_hex(average),
+            "dominant": to_hex(dominant),
+            "blurhash": encode_blurhash(factor),
+            "bbox": list(bbox) if bbox else None,
+        }
+        print(f"  {key}: {index[key]['blurhash']} bbox={index[key]['bbox']}")
+
+    with open(OUTPUT_PATH, "w", encoding="utf-8") as f:
+        json.dump({"version": 1, "images": index}, f, ensure_ascii=False, indent=2)
+
+    print(f"\n완료! {OUTPUT_PATH} ({OUTPUT_PATH.stat().st_size:,} bytes)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+크리처 카탈로그 컴파일러
+creature_catalog.json 하나를 기준으로
+
+1. id / 이름 / 희귀도 / 속성 / 스프라이트 경로 검증 (Assets/ 실제 파일과 대조)
+2. 생성 스크립트용 프롬프트 테이블 (creature_tables.py) 생성 - 크리처 + 알/놀이터 이미지 (eggs, playground)
+3. 앱 첫 실행 시 복사할 시드 DB (Assets/creatures_seed.db) 생성
+
+사용법: python compile_catalog.py [--check]
+"""
+
+import sys
+import json
+import sqlite3
+from pathlib import Path
+
+# 경로 설정
+SCRIPTS_DIR = Path(__file__).parent
+ASSETS_DIR = SCRIPTS_DIR.parent / "TypingTamagotchi" / "Assets"
+CATALOG_PATH = SCRIPTS_DIR / "creature_catalog.json"
+TABLES_PATH = SCRIPTS_DIR / "creature_tables.py"
+SEED_DB_PATH = ASSETS_DIR / "creatures_seed.db"
+
+# Models/Rarity.cs, Models/Element.cs 와 같은 순서
+RARITIES = ["Common", "Rare", "Epic", "Legendary"]
+ELEMENTS = ["Fire", "Water", "Wind", "Earth", "Lightning"]
+
+# 원본 스프라이트가 보는 방향 (PlaygroundCreature.LeftFacingCreatures / RightFacingCreatures)
+FACINGS = ["front", "left", "right"]
+
+# 알 프롬프트를 쓰는 스크립트 (generate_assets_gemini / regenerate_eggs / generate_legendary_egg)
+EGG_SOURCES = ["gemini", "regenerate", "legendary"]
+
+REQUIRED_FIELDS = ["id", "name", "name_en", "rarity", "element", "sprite", "description"]
+PROFILE_FIELDS = ["age", "gender", "favorite_food", "dislikes", "background"]
+
+# DatabaseService.InitializeDatabase 의 creatures 테이블과 동일해야 함
+CREATURES_SCHEMA = """
+CREATE TABLE IF NOT EXISTS creatures (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    rarity INTEGER NOT NULL,
+    element INTEGER NOT NULL DEFAULT 0,
+    sprite_path TEXT NOT NULL,
+    description TEXT NOT NULL,
+    age TEXT DEFAULT '',
+    gender TEXT DEFAULT '',
+    favorite_food TEXT DEFAULT '',
+    dislikes TEXT DEFAULT '',
+    background TEXT DEFAULT ''
+);
+
+CREATE INDEX IF NOT EXISTS idx_creatures_rarity_element ON creatures (rarity, element);
+CREATE INDEX IF NOT EXISTS idx_creatures_element ON creatures (element);
+CREATE INDEX IF NOT EXISTS idx_creatures_rarity_name ON creatures (rarity DESC, name);
+"""
+
+
+def load_catalog() -> list[dict]:
+    with open(CATALOG_PATH, encoding="utf-8") as f:
+        return json.load(f)["creatures"]
+
+
+def load_asset_prompts() -> tuple[list[dict], list[dict]]:
+    """크리처 외 생성 이미지 (알, 놀이터)"""
+    with open(CATALOG_PATH, encoding="utf-8") as f:
+        data = json.load(f)
+    return data.get("eggs", []), data.get("playground", [])
+
+
+def validate_assets(eggs: list[dict], playground: list[dict]) -> tuple[list[str], list[str]]:
+    """알/놀이터 항목 (에러, 경고) 목록"""
+    errors = []
+    warnings = []
+
+    for folder, entries, required in (
+        ("Eggs", eggs, ["file", "name", "source", "rarity", "prompt"]),
+        ("Playground", playground, ["file", "aspect_ratio", "prompt"]),
+    ):
+        for entry in entries:
+            label = f"{folder}/{entry.get('file')}"
+            missing = [key for key in required if not entry.get(key)]
+            if missing:
+                errors.append(f"{label}: 필수 필드 없음 {missing}")
+                continue
+            if entry.get("rarity", "Common") not in RARITIES:
+                errors.append(f"{label}: 알 수 없는 희귀도 {entry['rarity']}")
+            if not (ASSETS_DIR / folder / entry["file"]).exists():
+                warnings.append(f"{label}: 파일 없음")
+
+        files = [entry.get("file") for entry in entries]
+        duplicates = sorted({v for v in files if files.count(v) > 1})
+        if duplicates:
+            errors.append(f"{folder} 파일 중복: {duplicates}")
+
+    sources = [egg.get("source") for egg in eggs]
+    unknown = sorted({s for s in sources if s not in EGG_SOURCES})
+    if unknown:
+        errors.append(f"알 수 없는 알 source: {unknown}")
+    if sources.count("legendary") != 1:
+        errors.append("legendary 알은 정확히 하나여야 함")
+
+    return errors, warnings
+
+
+def validate(creatures: list[dict]) -> tuple[list[str], list[str]]:
+    """(에러, 경고) 목록"""
+    errors = []
+    warnings = []
+
+    for c in creatures:
+        label = f"#{c.get('id')} {c.get('name')}"
+        missing = [key for key in REQUIRED_FIELDS if not c.get(key)]
+        if missing:
+            errors.append(f"{label}: 필수 필드 없음 {missing}")
+            continue
+
+        if c["rarity"] not in RARITIES:
+            errors.append(f"{label}: 알 수 없는 희귀도 {c['rarity']}")
+        if c["element"] not in ELEMENTS:
+            errors.append(f"{label}: 알 수 없는 속성 {c['element']}")
+        if c.get("facing", "front") not in FACINGS:
+            errors.append(f"{label}: 알 수 없는 방향 {c['facing']}")
+
+        # 앱은 Creatures/{id}.png 규칙을 가정함 (ImageCacheService 썸네일 경로 포함)
+        if c["sprite"] != f"Creatures/{c['id']}.png":
+            errors.append(f"{label}: 스프라이트 경로가 id와 다름 ({c['sprite']})")
+        if not (ASSETS_DIR / c["sprite"]).exists():
+            errors.append(f"{label}: 스프라이트 파일 없음 ({c['sprite']})")
+        if not (ASSETS_DIR / c["sprite"].replace("Creatures/", "Creatures/thumbs/")).exists():
+            warnings.append(f"{label}: 썸네일 없음")
+        if not c.get("prompts"):
+            warnings.append(f"{label}: 프롬프트 없음 (생성 스크립트에서 제외)")
+
+    # id는 1부터 빈틈 없이 (기존 DB 마이그레이션이 개수로 판단함)
+    ids = [c.get("id") for c in creatures]
+    if ids != list(range(1, len(creatures) + 1)):
+        errors.append(f"id가 1~{len(creatures)} 순서대로가 아님")
+
+    for key in ("name", "name_en"):
+        values = [c.get(key) for c in creatures]
+        duplicates = sorted({v for v in values if values.count(v) > 1})
+        if duplicates:
+            errors.append(f"{key} 중복: {duplicates}")
+
+    return errors, warnings
+
+
+def literal(value) -> str:
+    """파이썬 문자열/숫자/bool 리터럴 (쌍따옴표)"""
+    if isinstance(value, bool):
+        return repr(value)
+    return json.dumps(value, ensure_ascii=False)
+
+
+def write_tables(creatures: list[dict], eggs: list[dict], playground: list[dict]):
+    """generate_*.py, regenerate_*.py, generation_queue.py가 import하는 테이블 (데이터만, 의존성 없음)"""
+    lines = [
+        "# 자동 생성 파일 - 직접 수정하지 말 것",
+        "# creature_catalog.json 수정 후 python compile_catalog.py 실행",
+        "",
+        "# Gemini Imagen 프롬프트 (id, 이름, 영문파일명, 프롬프트)",
+        "GEMINI_CREATURES = [",
+    ]
+    for c in creatures:
+        if "gemini" in c.get("prompts", {}):
+            fields = [c["id"], c["name"], c["name_en"], c["prompts"]["gemini"]]
+            lines.append(f"    ({', '.join(literal(v) for v in fields)}),")
+    lines += ["]", "", "# DALL-E 프롬프트 (id, 이름, 프롬프트)", "DALLE_CREATURES = ["]
+    for c in creatures:
+        if "dalle" in c.get("prompts", {}):
+            fields = [c["id"], c["name"], c["prompts"]["dalle"]]
+            lines.append(f"    ({', '.join(literal(v) for v in fields)}),")
+    lines += ["]", "", "# 희귀도 (id → Common/Rare/Epic/Legendary)", "CREATURE_RARITY = {"]
+    for c in creatures:
+        lines.append(f"    {c['id']}: {literal(c['rarity'])},")
+    lines += ["}", "", "# Gemini 알 프롬프트 (영문파일명, 이름, 프롬프트)", "GEMINI_EGGS = ["]
+    for egg in eggs:
+        if egg["source"] == "gemini":
+            fields = [egg["file"].removesuffix(".png"), egg["name"], egg["prompt"]]
+            lines.append(f"    ({', '.join(literal(v) for v in fields)}),")
+    lines += ["]", "", "# 재생성 알 프롬프트 (파일명, 프롬프트)", "REGENERATE_EGGS = ["]
+    for egg in eggs:
+        if egg["source"] == "regenerate":
+            lines.append(f"    ({literal(egg['file'])}, {literal(egg['prompt'])}),")
+    lines += ["]", ""]
+    legendary = next(egg for egg in eggs if egg["source"] == "legendary")
+    lines += ["# 전설 알 프롬프트", f"LEGENDARY_EGG_PROMPT = {literal(legendary['prompt'])}", ""]
+    lines += ["# 놀이터 프롬프트 (이름, 프롬프트, 비율, 배경 제거)", "PLAYGROUND_ASSETS = ["]
+    for asset in playground:
+        fields = [asset["file"].removesuffix(".png"), asset["prompt"], asset["aspect_ratio"], asset.get("matte", False)]
+        lines.append(f"    ({', '.join(literal(v) for v in fields)}),")
+    lines += ["]", "", "# 알 희귀도 (Eggs 파일명 → Common/.../Legendary)", "EGG_RARITY = {"]
+    for egg in eggs:
+        lines.append(f"    {literal(egg['file'])}: {literal(egg['rarity'])},")
+    lines += ["}", ""]
+
+    with open(TABLES_PATH, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines))
+
+
+def build_seed_db(creatures: list[dict]):
+    """creatures 테이블만 채운 시드 DB (나머지 테이블은 앱이 CREATE IF NOT EXISTS로 생성)"""
+    tmp_path = SEED_DB_PATH.with_suffix(".db.tmp")
+    tmp_path.unlink(missing_ok=True)
+
+    conn = sqlite3.connect(tmp_path)
+    conn.executescript(CREATURES_SCHEMA)
+    conn.executemany(
+        """
+        INSERT INTO creatures (id, name, rarity, element, sprite_path, description,
+                               age, gender, favorite_food, dislikes, background)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+        [
+            (c["id"], c["name"], RARITIES.index(c["rarity"]), ELEMENTS.index(c["element"]),
+             c["sprite"], c["description"], *(c.get(key, "") for key in PROFILE_FIELDS))
+            for c in creatures
+        ],
+    )
+    conn.execute(f"PRAGMA user_version = {len(creatures)}")
+    conn.commit()
+    conn.execute("VACUUM")
+    conn.close()
+
+    tmp_path.replace(SEED_DB_PATH)
+
+
+def main():
+    check_only = "--check" in sys.argv[1:]
+    creatures = load_catalog()
+    eggs, playground = load_asset_prompts()
+
+    errors, warnings = validate(creatures)
+    asset_errors, asset_warnings = validate_assets(eggs, playground)
+    errors += asset_errors
+    warnings += asset_warnings
+    for warning in warnings:
+        print(f"  ⚠️ {warning}")
+    for error in errors:
+        print(f"  ❌ {error}")
+    if errors:
+        print(f"\n검증 실패: 에러 {len(errors)}개")
+        sys.exit(1)
+
+    print(f"검증 완료: 크리처 {len(creatures)}종, 알 {len(eggs)}개, 놀이터 {len(playground)}개")
+    if check_only:
+        return
+
+    write_tables(creatures, eggs, playground)
+    print(f"  ✅ 프롬프트 테이블: {TABLES_PATH}")
+
+    build_seed_db(creatures)
+    print(f"  ✅ 시드 DB: {SEED_DB_PATH} ({SEED_DB_PATH.stat().st_size:,} bytes)")
+
+
+if __name__ == "__main__":
+    main()
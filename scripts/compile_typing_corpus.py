@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+타자 연습 문장 컴파일러 (Assets/typing_corpus.json)
+typing_sentences*.json 세 파일을 읽어 문장마다 키 입력 정보를 미리 계산하고 난이도별로 정렬
+
+문장 항목:
+    text         원문
+    translation  번역 (영어 격언만)
+    jamo         키 입력 단위 자모열 (겹모음/겹받침은 분해) - 자모 하나 = 키 하나
+    offsets      원문 글자 i의 키 입력 시작 위치 (len(text) + 1개)
+                 (jamo/offsets는 한글 문장만, 영어/코드는 원문이 곧 키 열)
+                 물리 키는 DUBEOLSIK_KEYS로 1:1 변환되므로 따로 저장하지 않음
+    keystrokes   총 키 입력 수
+    score        난이도 점수 (0~1)
+
+코퍼스마다 levels[d] = [시작, 끝) 으로 난이도 d 구간을 기록해서 앱은 구간 안에서 난수 하나로 문장 선택
+
+사용법: python compile_typing_corpus.py
+"""
+
+import json
+import math
+from pathlib import Path
+
+# 경로 설정
+ASSETS_DIR = Path(__file__).parent.parent / "TypingTamagotchi" / "Assets"
+OUTPUT_PATH = ASSETS_DIR / "typing_corpus.json"
+
+# (코퍼스 이름, 원본 파일)
+CORPORA = [
+    ("ko", "typing_sentences.json"),
+    ("en", "typing_sentences_en.json"),
+    ("code", "typing_sentences_code.json"),
+]
+
+LEVELS = 3  # 쉬움 / 보통 / 어려움
+
+# 난이도 가중치 (각 항목은 코퍼스 안에서 백분위로 정규화)
+WEIGHTS = {"rarity": 0.4, "shift": 0.3, "length": 0.3}
+
+# === 한글 분해 ===
+
+HANGUL_BASE = 0xAC00
+HANGUL_LAST = 0xD7A3
+
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+JUNGSEONG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+JONGSEONG = ["", *"ㄱㄲㄳㄴㄵㄶㄷㄹㄺㄻㄼㄽㄾㄿㅀㅁㅂㅄㅅㅆㅇㅈㅊㅋㅌㅍㅎ"]
+
+# 두 번 눌러야 하는 겹모음/겹받침
+COMPOUND_JAMO = {
+    "ㅘ": "ㅗㅏ", "ㅙ": "ㅗㅐ", "ㅚ": "ㅗㅣ", "ㅝ": "ㅜㅓ", "ㅞ": "ㅜㅔ", "ㅟ": "ㅜㅣ", "ㅢ": "ㅡㅣ",
+    "ㄳ": "ㄱㅅ", "ㄵ": "ㄴㅈ", "ㄶ": "ㄴㅎ", "ㄺ": "ㄹㄱ", "ㄻ": "ㄹㅁ", "ㄼ": "ㄹㅂ",
+    "ㄽ": "ㄹㅅ", "ㄾ": "ㄹㅌ", "ㄿ": "ㄹㅍ", "ㅀ": "ㄹㅎ", "ㅄ": "ㅂㅅ",
+}
+
+# 두벌식 자판 (대문자 = Shift)
+DUBEOLSIK_KEYS = {
+    "ㄱ": "r", "ㄲ": "R", "ㄴ": "s", "ㄷ": "e", "ㄸ": "E", "ㄹ": "f", "ㅁ": "a", "ㅂ": "q", "ㅃ": "Q",
+    "ㅅ": "t", "ㅆ": "T", "ㅇ": "d", "ㅈ": "w", "ㅉ": "W", "ㅊ": "c", "ㅋ": "z", "ㅌ": "x", "ㅍ": "v", "ㅎ": "g",
+    "ㅏ": "k", "ㅐ": "o", "ㅑ": "i", "ㅒ": "O", "ㅓ": "j", "ㅔ": "p", "ㅕ": "u", "ㅖ": "P",
+    "ㅗ": "h", "ㅛ": "y", "ㅜ": "n", "ㅠ": "b", "ㅡ": "m", "ㅣ": "l",
+}
+
+# US 배열에서 Shift가 필요한 기호
+SHIFT_SYMBOLS = set('~!@#$%^&*()_+{}|:"<>?')
+
+
+def decompose(char: str) -> str:
+    """글자 하나 → 키 입력 단위 자모열 (한글 음절이 아니면 그대로)"""
+    code = ord(char)
+    if not HANGUL_BASE <= code <= HANGUL_LAST:
+        return COMPOUND_JAMO.get(char, char)
+
+    index = code - HANGUL_BASE
+    cho, rest = divmod(index, 21 * 28)
+    jung, jong = divmod(rest, 28)
+    jamo = CHOSEONG[cho] + JUNGSEONG[jung] + JONGSEONG[jong]
+    return "".join(COMPOUND_JAMO.get(j, j) for j in jamo)
+
+
+def is_shift(key: str) -> bool:
+    return key.isupper() or key in SHIFT_SYMBOLS
+
+
+def to_keys(jamo: str) -> str:
+    """자모열 → 두벌식 물리 키 열 (대문자 = Shift)"""
+    return "".join(DUBEOLSIK_KEYS.get(j, j) for j in jamo)
+
+
+def compile_sentence(text: str) -> dict:
+    jamo = ""
+    offsets = []
+    for char in text:
+        offsets.append(len(jamo))
+        jamo += decompose(char)
+    offsets.append(len(jamo))
+
+    entry = {"text": text, "keystrokes": len(jamo)}
+    # 영어/코드는 원문이 곧 키 열이므로 생략
+    if jamo != text:
+        entry.update(jamo=jamo, offsets=offsets)
+    return entry
+
+
+# === 난이도 ===
+
+def percentile_ranks(values: list[float]) -> list[float]:
+    """값 → 코퍼스 안에서의 백분위 (0~1, 동점은 평균 순위)"""
+    if len(values) < 2:
+        return [0.0] * len(values)
+    order = sorted(range(len(values)), key=lambda i: values[i])
+    ranks = [0.0] * len(values)
+    i = 0
+    while i < len(order):
+        j = i
+        while j + 1 < len(order) and values[order[j + 1]] == values[order[i]]:
+            j += 1
+        for k in range(i, j + 1):
+            ranks[order[k]] = (i + j) / 2 / (len(values) - 1)
+        i = j + 1
+    return ranks
+
+
+def score_corpus(entries: list[dict]):
+    """희귀 자모(문자) / Shift 비율 / 길이 → score"""
+    # 한글은 자모 단위, 영어/코드는 원문 문자 단위 (ㄲ/ㄱ, A/a는 서로 다른 글자로 셈 - Shift는 따로 반영)
+    units = [[u for u in entry.get("jamo", entry["text"]) if u != " "] for entry in entries]
+
+    counts = {}
+    for entry_units in units:
+        for unit in entry_units:
+            counts[unit] = counts.get(unit, 0) + 1
+    total = sum(counts.values())
+
+    rarity, shift, length = [], [], []
+    for entry, entry_units in zip(entries, units):
+        # 코퍼스에서 드물게 나오는 자모/문자일수록 -log(빈도)가 큼
+        rarity.append(sum(-math.log(counts[u] / total) for u in entry_units) / max(1, len(entry_units)))
+        shift.append(sum(is_shift(k) for k in to_keys(entry_units)) / max(1, len(entry_units)))
+        length.append(entry["keystrokes"])
+
+    components = {
+        "rarity": percentile_ranks(rarity),
+        "shift": percentile_ranks(shift),
+        "length": percentile_ranks(length),
+    }
+    for i, entry in enumerate(entries):
+        entry["score"] = round(sum(WEIGHTS[name] * components[name][i] for name in WEIGHTS), 4)
+
+
+def compile_corpus(sentences: list) -> dict:
+    entries = []
+    for sentence in sentences:
+        if isinstance(sentence, dict):
+            entry = compile_sentence(sentence["en"])
+            entry["translation"] = sentence.get("ko", "")
+        else:
+            entry = compile_sentence(sentence)
+        entries.append(entry)
+
+    score_corpus(entries)
+    entries.sort(key=lambda e: e["score"])
+
+    # 점수 순으로 LEVELS 등분 → 난이도별 [시작, 끝)
+    levels = []
+    for level in range(LEVELS):
+        start = len(entries) * level // LEVELS
+        end = len(entries) * (level + 1) // LEVELS
+        levels.append([start, end])
+
+    return {"levels": levels, "sentences": entries}
+
+
+def main():
+    print("=== 타자 연습 문장 컴파일 ===\n")
+
+    corpora = {}
+    for name, filename in CORPORA:
+        with open(ASSETS_DIR / filename, encoding="utf-8") as f:
+            sentences = json.load(f)["sentences"]
+
+        corpus = compile_corpus(sentences)
+        corpora[name] = corpus
+
+        keystrokes = sum(e["keystrokes"] for e in corpus["sentences"])
+        print(f"  {name}: {len(sentences)}문장, 키 입력 {keystrokes:,}회, 난이도 구간 {corpus['levels']}")
+
+    with open(OUTPUT_PATH, "w", encoding="utf-8") as f:
+        json.dump({"version": 1, "corpora": corpora}, f, ensure_ascii=False, separators=(",", ":"))
+
+    print(f"\n완료! {OUTPUT_PATH} ({OUTPUT_PATH.stat().st_size:,} bytes)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,209 @@
+# 자동 생성 파일 - 직접 수정하지 말 것
+# creature_catalog.json 수정 후 python compile_catalog.py 실행
+
+# Gemini Imagen 프롬프트 (id, 이름, 영문파일명, 프롬프트)
+GEMINI_CREATURES = [
+    (1, "슬라임", "slime", "cute pixel art slime, 64x64 pixels, simple round shape, bright pastel green, translucent, game asset, transparent background, tamagotchi style"),
+    (2, "꼬마구름", "tiny_cloud", "cute pixel art tiny cloud, 64x64 pixels, simple fluffy shape, bright pastel white, happy face, game asset, transparent background, tamagotchi style"),
+    (3, "잎새", "leaf", "cute pixel art leaf creature, 64x64 pixels, simple green leaf with face, bright pastel tones, game asset, transparent background, tamagotchi style"),
+    (4, "물방울", "water_drop", "cute pixel art water droplet, 64x64 pixels, simple blue drop with face, bright pastel tones, shiny, game asset, transparent background, tamagotchi style"),
+    (5, "돌멩이", "pebble", "cute pixel art rock creature, 64x64 pixels, simple gray stone with face, bright pastel tones, round, game asset, transparent background, tamagotchi style"),
+    (6, "별똥별", "shooting_star", "cute pixel art shooting star, 64x64 pixels, simple yellow star with tail, bright pastel tones, game asset, transparent background, tamagotchi style"),
+    (7, "꽃잎", "petal", "cute pixel art flower petal, 64x64 pixels, simple pink petal with face, bright pastel tones, game asset, transparent background, tamagotchi style"),
+    (8, "솜뭉치", "cotton_ball", "cute pixel art cotton ball, 64x64 pixels, simple fluffy white puff with face, bright pastel tones, soft, game asset, transparent background, tamagotchi style"),
+    (9, "젤리콩", "jelly_bean", "cute pixel art jelly bean, 64x64 pixels, simple candy shape with face, bright pastel colors, shiny, game asset, transparent background, tamagotchi style"),
+    (10, "이끼돌", "moss_rock", "cute pixel art mossy rock, 64x64 pixels, simple stone with green moss and face, bright pastel tones, game asset, transparent background, tamagotchi style"),
+    (11, "눈송이", "snowflake", "cute pixel art snowflake, 64x64 pixels, simple ice crystal with face, bright pastel blue white, game asset, transparent background, tamagotchi style"),
+    (12, "반딧불", "firefly", "cute pixel art firefly, 64x64 pixels, simple glowing bug with face, bright pastel yellow, game asset, transparent background, tamagotchi style"),
+    (13, "씨앗", "seed", "cute pixel art seed, 64x64 pixels, simple brown seed with face and tiny sprout, bright pastel tones, game asset, transparent background, tamagotchi style"),
+    (14, "조약돌", "river_stone", "cute pixel art smooth pebble, 64x64 pixels, simple river stone with face, bright pastel gray, game asset, transparent background, tamagotchi style"),
+    (15, "먼지토끼", "dust_bunny", "cute pixel art dust bunny, 64x64 pixels, simple gray fluff ball with ears and face, bright pastel tones, fuzzy, game asset, transparent background, tamagotchi style"),
+    (16, "비누방울", "soap_bubble", "cute pixel art soap bubble, 64x64 pixels, simple rainbow bubble with face, bright pastel tones, shiny, game asset, transparent background, tamagotchi style"),
+    (17, "도토리", "acorn", "cute pixel art acorn, 64x64 pixels, simple brown acorn with face, bright pastel tones, game asset, transparent background, tamagotchi style"),
+    (18, "꿀방울", "honey_drop", "cute pixel art honey drop, 64x64 pixels, simple golden honey with face, bright pastel yellow, sticky, game asset, transparent background, tamagotchi style"),
+    (19, "깃털", "feather", "cute pixel art feather, 64x64 pixels, simple soft feather with face, bright pastel white, fluffy, game asset, transparent background, tamagotchi style"),
+    (20, "이슬", "dewdrop", "cute pixel art dewdrop, 64x64 pixels, simple morning dew with face, bright pastel blue, crystal clear, game asset, transparent background, tamagotchi style"),
+    (21, "모래알", "sand_grain", "cute pixel art sand grain, 64x64 pixels, simple tiny sand with face, bright pastel beige, game asset, transparent background, tamagotchi style"),
+    (22, "풀잎", "grass_blade", "cute pixel art grass blade, 64x64 pixels, simple green grass with face, bright pastel tones, game asset, transparent background, tamagotchi style"),
+    (23, "나뭇가지", "twig", "cute pixel art twig, 64x64 pixels, simple brown stick with face, bright pastel tones, woody, game asset, transparent background, tamagotchi style"),
+    (24, "진흙이", "mud_blob", "cute pixel art mud blob, 64x64 pixels, simple brown mud with face, bright pastel tones, squishy, game asset, transparent background, tamagotchi style"),
+    (25, "버섯", "mushroom", "cute pixel art mushroom, 64x64 pixels, simple red mushroom with white dots and face, bright pastel tones, game asset, transparent background, tamagotchi style"),
+    (26, "번개토끼", "lightning_rabbit", "cute pixel art electric bunny, 64x64 pixels, yellow fur, blue lightning sparks, subtle electric glow, game asset, transparent background, tamagotchi style"),
+    (27, "불꽃여우", "fire_fox", "cute pixel art fire fox, 64x64 pixels, orange fur, blue flame tip, subtle heat haze effect, game asset, transparent background, tamagotchi style"),
+    (28, "얼음펭귄", "ice_penguin", "cute pixel art ice penguin, 64x64 pixels, blue ice crystals, subtle snow frost effect, winter theme, game asset, transparent background, tamagotchi style"),
+    (29, "바람새", "wind_bird", "cute pixel art wind bird, 64x64 pixels, light blue feathers, subtle wind swirls, floating, game asset, transparent background, tamagotchi style"),
+    (30, "꽃사슴", "flower_deer", "cute pixel art flower deer, 64x64 pixels, blue flower antlers, subtle petal wind, spring theme, game asset, transparent background, tamagotchi style"),
+    (31, "달토끼", "moon_rabbit", "cute pixel art moon rabbit, 64x64 pixels, silver white fur, crescent moon motif, blue glow, subtle starlight, game asset, transparent background, tamagotchi style"),
+    (32, "무지개뱀", "rainbow_snake", "cute pixel art rainbow snake, 64x64 pixels, colorful scales, blue accents, subtle shimmer effect, friendly face, game asset, transparent background, tamagotchi style"),
+    (33, "구름고래", "cloud_whale", "cute pixel art cloud whale, 64x64 pixels, fluffy white body, blue sky theme, subtle floating effect, game asset, transparent background, tamagotchi style"),
+    (34, "수정나비", "crystal_butterfly", "cute pixel art crystal butterfly, 64x64 pixels, gem wings, blue sparkles, subtle prismatic glow, game asset, transparent background, tamagotchi style"),
+    (35, "숲요정", "forest_fairy", "cute pixel art forest fairy, 64x64 pixels, leaf wings, blue flower crown, subtle nature glow, tiny, game asset, transparent background, tamagotchi style"),
+    (36, "별똥곰", "star_bear", "cute pixel art star bear, 64x64 pixels, constellation pattern fur, blue starlight, subtle cosmic aura, game asset, transparent background, tamagotchi style"),
+    (37, "파도물개", "wave_seal", "cute pixel art wave seal, 64x64 pixels, ocean blue body, water splash, subtle bubble effect, game asset, transparent background, tamagotchi style"),
+    (38, "안개늑대", "mist_wolf", "cute pixel art mist wolf, 64x64 pixels, gray fur, blue mist, subtle fog effect, mysterious, game asset, transparent background, tamagotchi style"),
+    (39, "노을새", "sunset_bird", "cute pixel art sunset bird, 64x64 pixels, orange pink gradient feathers, blue accents, subtle warm glow, game asset, transparent background, tamagotchi style"),
+    (40, "이끼거북", "moss_turtle", "cute pixel art moss turtle, 64x64 pixels, green shell with plants, blue flowers, subtle nature aura, game asset, transparent background, tamagotchi style"),
+    (41, "용아기", "baby_dragon", "cute pixel art baby dragon, 64x64 pixels, purple and pink fire effects, flashy magical aura, big innocent eyes, game asset, transparent background, tamagotchi style"),
+    (42, "유니콘", "unicorn", "cute pixel art unicorn, 64x64 pixels, rainbow mane, golden horn, purple sparkling dust, flashy magical trail, game asset, transparent background, tamagotchi style"),
+    (43, "피닉스", "phoenix", "cute pixel art baby phoenix, 64x64 pixels, glowing purple flames, pink feather accents, flashy fire particles, game asset, transparent background, tamagotchi style"),
+    (44, "크라켄", "kraken", "cute pixel art baby kraken, 64x64 pixels, purple glowing tentacles, pink bubble effects, flashy underwater aura, game asset, transparent background, tamagotchi style"),
+    (45, "그리폰", "griffin", "cute pixel art baby griffin, 64x64 pixels, purple magical wings, pink glow, flashy stardust effect, game asset, transparent background, tamagotchi style"),
+    (46, "켈피", "kelpie", "cute pixel art water horse, 64x64 pixels, purple misty mane, pink water droplets, flashy mystical aura, game asset, transparent background, tamagotchi style"),
+    (47, "바실리스크", "basilisk", "cute pixel art baby basilisk, 64x64 pixels, purple scale patterns, pink glowing eyes, flashy toxic mist effect, game asset, transparent background, tamagotchi style"),
+    (48, "황금드래곤", "golden_dragon", "cute pixel art golden baby dragon, 64x64 pixels, golden scales, small wings, big sparkly eyes, glowing golden border, sparkling glitter effect, mysterious legendary aura, game asset, transparent background, tamagotchi style"),
+    (49, "세계수정령", "world_tree_spirit", "cute pixel art ancient tree spirit, 64x64 pixels, lush greenery, glowing golden border, nature essence, magical floating leaves, mysterious aura, game asset, transparent background, tamagotchi style"),
+    (50, "시간고양이", "time_cat", "cute pixel art cosmic cat, 64x64 pixels, galaxy pattern fur, clock motifs, glowing golden border, floating star particles, mysterious aura, game asset, transparent background, tamagotchi style"),
+    (51, "지우개똥", "eraser_poop", "cute pixel art eraser shavings crumbs creature, 64x64 pixels, small gray-pink rubber debris bits with cute face, simple round blob shape, bright pastel tones, game asset, solid transparent background, no background elements, tamagotchi style"),
+    (52, "네시", "nessie", "cute pixel art loch ness monster, 64x64 pixels, long neck sea serpent, green body, cute shy expression, simple design, game asset, solid transparent background, no background elements, tamagotchi style"),
+    (53, "빅풋", "bigfoot", "cute pixel art bigfoot sasquatch, 64x64 pixels, fluffy brown fur, big friendly eyes, big cute feet, simple design, game asset, solid transparent background, no background elements, tamagotchi style"),
+]
+
+# DALL-E 프롬프트 (id, 이름, 프롬프트)
+DALLE_CREATURES = [
+    (1, "슬라임", "slime, translucent green, jiggly, simple, classic"),
+    (2, "꼬마구름", "tiny cloud, white fluffy, floating, happy face"),
+    (3, "잎새", "leaf creature, green leaf body, floating"),
+    (4, "물방울", "water drop, blue translucent, shiny"),
+    (5, "돌멩이", "rock creature, gray stone, round"),
+    (6, "별똥별", "tiny star, yellow glowing, trail"),
+    (7, "꽃잎", "flower petal, pink petal body, floating"),
+    (8, "솜뭉치", "cotton ball, white fluffy, round, soft"),
+    (9, "젤리콩", "jelly bean, colorful, translucent, bouncy"),
+    (10, "이끼돌", "mossy rock, gray with green moss"),
+    (11, "눈송이", "snowflake, white crystalline, sparkling"),
+    (12, "반딧불", "firefly, yellow glow, tiny wings, night"),
+    (13, "씨앗", "seed, brown oval, tiny sprout"),
+    (14, "조약돌", "pebble, smooth gray, round"),
+    (15, "먼지토끼", "dust bunny, gray fluffy, round, floating"),
+    (16, "비누방울", "soap bubble, rainbow iridescent, floating"),
+    (17, "도토리", "acorn, brown cap, tan body"),
+    (18, "꿀방울", "honey drop, golden amber, shiny"),
+    (19, "깃털", "feather, white soft, floating"),
+    (20, "이슬", "dew drop, clear sparkly, on leaf"),
+    (21, "모래알", "sand grain, beige tiny, beach"),
+    (22, "풀잎", "grass blade, green simple, swaying"),
+    (23, "나뭇가지", "twig, brown stick, tiny leaves"),
+    (24, "진흙이", "mud blob, brown squishy"),
+    (25, "버섯", "mushroom, red cap white spots"),
+    (26, "번개토끼", "electric bunny, yellow fur, lightning bolt ears, sparks"),
+    (27, "불꽃여우", "fire fox, orange fur, flame tail, warm colors"),
+    (28, "얼음펭귄", "ice penguin, blue and white, ice crystals, winter scarf"),
+    (29, "바람새", "wind bird, light blue feathers, wind swirls, floating"),
+    (30, "꽃사슴", "flower deer, brown body, flower antlers, pink blossoms"),
+    (31, "달토끼", "moon bunny, white fur, crescent moon, glowing, night"),
+    (32, "무지개뱀", "rainbow snake, colorful scales, rainbow pattern, friendly"),
+    (33, "구름고래", "cloud whale, white fluffy body, floating, sky blue, dreamy"),
+    (34, "수정나비", "crystal butterfly, transparent wings, sparkles, magical"),
+    (35, "숲요정", "forest fairy, green outfit, leaf wings, tiny, nature"),
+    (36, "별똥곰", "star bear, dark blue fur, star patterns, glowing, night sky"),
+    (37, "파도물개", "wave seal, blue-gray body, water splash, ocean"),
+    (38, "안개늑대", "mist wolf, gray fur, misty aura, mysterious, ethereal"),
+    (39, "노을새", "sunset bird, orange and pink feathers, warm glow, evening"),
+    (40, "이끼거북", "moss turtle, green shell with plants, flowers on back, garden"),
+    (41, "용아기", "baby dragon, red scales, tiny wings, breathing small flame, innocent"),
+    (42, "유니콘", "unicorn, white body, rainbow mane, golden horn, sparkles, magical"),
+    (43, "피닉스", "baby phoenix, orange and red feathers, small flames, golden eyes"),
+    (44, "크라켄", "baby kraken, purple tentacles, big round eyes, underwater, bubbles"),
+    (45, "그리폰", "baby griffin, eagle head, lion body, small wings, golden feathers"),
+    (46, "켈피", "water horse, blue-green colors, seaweed mane, water drops, mystical"),
+    (47, "바실리스크", "baby basilisk, green scales, crown pattern, yellow eyes, not scary"),
+    (48, "황금드래곤", "golden baby dragon, golden scales, small wings, sparkly, legendary aura, glowing"),
+    (49, "세계수정령", "tree spirit, green and brown, leaf crown, nature essence, magical particles, forest guardian"),
+    (50, "시간고양이", "cosmic cat, galaxy pattern fur, clock motifs, mysterious, floating stars, purple and blue"),
+]
+
+# 희귀도 (id → Common/Rare/Epic/Legendary)
+CREATURE_RARITY = {
+    1: "Common",
+    2: "Common",
+    3: "Common",
+    4: "Common",
+    5: "Common",
+    6: "Common",
+    7: "Common",
+    8: "Common",
+    9: "Common",
+    10: "Common",
+    11: "Common",
+    12: "Common",
+    13: "Common",
+    14: "Common",
+    15: "Common",
+    16: "Common",
+    17: "Common",
+    18: "Common",
+    19: "Common",
+    20: "Common",
+    21: "Common",
+    22: "Common",
+    23: "Common",
+    24: "Common",
+    25: "Common",
+    26: "Rare",
+    27: "Rare",
+    28: "Rare",
+    29: "Rare",
+    30: "Rare",
+    31: "Rare",
+    32: "Rare",
+    33: "Rare",
+    34: "Rare",
+    35: "Rare",
+    36: "Rare",
+    37: "Rare",
+    38: "Rare",
+    39: "Rare",
+    40: "Rare",
+    41: "Epic",
+    42: "Epic",
+    43: "Epic",
+    44: "Epic",
+    45: "Epic",
+    46: "Epic",
+    47: "Epic",
+    48: "Legendary",
+    49: "Legendary",
+    50: "Legendary",
+    51: "Common",
+    52: "Legendary",
+    53: "Legendary",
+    54: "Epic",
+}
+
+# Gemini 알 프롬프트 (영문파일명, 이름, 프롬프트)
+GEMINI_EGGS = [
+    ("fire_egg", "불꽃알", "cute pixel art fire egg, 64x64 pixels, orange with flame pattern, subtle glow, game asset, transparent background, tamagotchi style"),
+    ("water_egg", "물방울알", "cute pixel art water egg, 64x64 pixels, blue with water drops, translucent, game asset, transparent background, tamagotchi style"),
+    ("wind_egg", "바람알", "cute pixel art wind egg, 64x64 pixels, light green with swirl pattern, airy, game asset, transparent background, tamagotchi style"),
+    ("earth_egg", "대지알", "cute pixel art earth egg, 64x64 pixels, brown with crystal pattern, solid, game asset, transparent background, tamagotchi style"),
+    ("lightning_egg", "번개알", "cute pixel art lightning egg, 64x64 pixels, yellow with electric pattern, subtle sparks, game asset, transparent background, tamagotchi style"),
+]
+
+# 재생성 알 프롬프트 (파일명, 프롬프트)
+REGENERATE_EGGS = [
+    ("불꽃알.png", "A single egg object only, no animals no creatures,\npixel art style egg shape, 64x64 pixels,\norange and red colored egg shell with flame pattern decorations,\nfire element theme egg, warm colors,\nsimple game asset, white background, cute tamagotchi style"),
+    ("물방울알.png", "A single egg object only, no animals no creatures,\npixel art style egg shape, 64x64 pixels,\nblue colored egg shell with water bubble pattern decorations,\nwater element theme egg, ocean blue colors,\nsimple game asset, white background, cute tamagotchi style"),
+    ("바람알.png", "A single egg object only, no animals no creatures,\npixel art style egg shape, 64x64 pixels,\nlight green colored egg shell with swirl wind pattern decorations,\nwind element theme egg, mint green colors,\nsimple game asset, white background, cute tamagotchi style"),
+]
+
+# 전설 알 프롬프트
+LEGENDARY_EGG_PROMPT = "A single egg object only, no animals no creatures,\npixel art style egg shape, 64x64 pixels,\nBRIGHT GOLD colored egg shell, shiny metallic golden surface,\ngolden crown on top of the egg, golden sparkle stars around,\nroyal legendary precious egg, diamond gem decorations,\nluxury golden treasure egg, yellow gold color,\nsimple game asset, white background, cute tamagotchi style"
+
+# 놀이터 프롬프트 (이름, 프롬프트, 비율, 배경 제거)
+PLAYGROUND_ASSETS = [
+    ("background", "pixel art simple grassy field background only, 400x150 pixels wide horizontal format, green grass texture at bottom, light blue gradient sky, small white clouds, tiny colorful flowers in grass, NO animals, NO characters, NO creatures, empty landscape scene, game background asset, clean minimal style", "16:9", False),
+    ("bump_effect", "cute pixel art comic impact effect, 64x64 pixels, bold text 'BUMP!' in comic style, yellow and orange starburst explosion behind text, action lines radiating outward, cartoon collision effect, game asset, transparent background, kawaii style", "1:1", True),
+]
+
+# 알 희귀도 (Eggs 파일명 → Common/.../Legendary)
+EGG_RARITY = {
+    "fire_egg.png": "Common",
+    "water_egg.png": "Common",
+    "wind_egg.png": "Common",
+    "earth_egg.png": "Common",
+    "lightning_egg.png": "Common",
+    "불꽃알.png": "Common",
+    "물방울알.png": "Common",
+    "바람알.png": "Common",
+    "전설알.png": "Legendary",
+}
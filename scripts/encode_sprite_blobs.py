@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+스프라이트 빠른 디코드 포맷 인코더 (.tcsb)
+PNG → premultiplied BGRA + LZ4 블록 압축
+
+Avalonia는 Bgra8888 + AlphaFormat.Premul 픽셀 버퍼로 Bitmap을 바로 만들 수 있으므로
+앱에서는 LZ4 해제 한 번이면 끝남 (zlib inflate / 필터 / 색변환 없음)
+
+헤더 (little-endian, 16바이트):
+    magic       4s   b"TCSB"
+    version     u8   1
+    flags       u8   bit0 = premultiplied alpha
+    reserved    u16  0
+    width       u16
+    height      u16
+    raw_size    u32  압축 해제 후 크기 (width * height * 4)
+이후 LZ4 블록 데이터 (크기 prefix 없음)
+
+출력은 scripts/sprite_blobs/ 아래 Assets와 같은 폴더 구조로 저장
+(Assets/** 는 통째로 AvaloniaResource로 임베드되므로 앱이 .tcsb를 읽기 전까지는 Assets 밖에 둠)
+
+사용법: python encode_sprite_blobs.py [폴더명 ...]
+"""
+
+import sys
+import struct
+from pathlib import Path
+
+import lz4.block
+import numpy as np
+from PIL import Image
+
+# 경로 설정
+ASSETS_DIR = Path(__file__).parent.parent / "TypingTamagotchi" / "Assets"
+OUTPUT_DIR = Path(__file__).parent / "sprite_blobs"
+
+# 원본 이미지 폴더 (하위 폴더는 따로 지정 - trimmed/, Pets/ 같은 생성물은 제외)
+SOURCE_DIRS = ["Creatures", "Creatures/thumbs", "Eggs", "UI", "Playground"]
+
+MAGIC = b"TCSB"
+VERSION = 1
+FLAG_PREMULTIPLIED = 0x01
+HEADER = struct.Struct("<4sBBHHHI")
+SUFFIX = ".tcsb"
+
+
+def to_premultiplied_bgra(rgba: np.ndarray) -> np.ndarray:
+    """RGBA (H, W, 4) uint8 → premultiplied BGRA (H, W, 4) uint8"""
+    alpha = rgba[..., 3:4].astype(np.uint16)
+    rgb = (rgba[..., :3].astype(np.uint16) * alpha + 127) // 255
+    bgra = np.empty_like(rgba)
+    bgra[..., 0] = rgb[..., 2]
+    bgra[..., 1] = rgb[..., 1]
+    bgra[..., 2] = rgb[..., 0]
+    bgra[..., 3] = rgba[..., 3]
+    return bgra
+
+
+def encode(png_path: Path) -> bytes:
+    """PNG 파일 → .tcsb 바이트"""
+    with Image.open(png_path) as img:
+        rgba = np.asarray(img.convert("RGBA"))
+
+    height, width = rgba.shape[:2]
+    raw = to_premultiplied_bgra(rgba).tobytes()
+    payload = lz4.block.compress(raw, mode="high_compression", compression=12, store_size=False)
+
+    header = HEADER.pack(MAGIC, VERSION, FLAG_PREMULTIPLIED, 0, width, height, len(raw))
+    return header + payload
+
+
+def decode(blob: bytes) -> np.ndarray:
+    """.tcsb 바이트 → premultiplied BGRA (H, W, 4) uint8"""
+    magic, version, _flags, _reserved, width, height, raw_size = HEADER.unpack_from(blob)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"지원하지 않는 포맷: {magic!r} v{version}")
+
+    raw = lz4.block.decompress(blob[HEADER.size:], uncompressed_size=raw_size)
+    return np.frombuffer(raw, dtype=np.uint8).reshape(height, width, 4)
+
+
+def collect_pngs(folders: list[str]) -> list[Path]:
+    paths = []
+    for name in folders:
+        paths += sorted((ASSETS_DIR / name).glob("*.png"))
+    return paths
+
+
+def blob_path_for(png_path: Path) -> Path:
+    """Assets/Creatures/1.png → sprite_blobs/Creatures/1.tcsb"""
+    return OUTPUT_DIR / png_path.relative_to(ASSETS_DIR).with_suffix(SUFFIX)
+
+
+def main():
+    # 인자로 특정 폴더만 변환 가능 (예: Creatures)
+    folders = sys.argv[1:] or SOURCE_DIRS
+    png_paths = collect_pngs(folders)
+
+    if not png_paths:
+        print(f"PNG 없음: {folders}")
+        return
+
+    print(f"=== .tcsb 변환 ({len(png_paths)}개) ===\n")
+
+    total_png = 0
+    total_blob = 0
+    for png_path in png_paths:
+        blob = encode(png_path)
+        out_path = blob_path_for(png_path)
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(out_path, "wb") as f:
+            f.write(blob)
+
+        png_size = png_path.stat().st_size
+        total_png += png_size
+        total_blob += len(blob)
+        print(f"  {png_path.relative_to(ASSETS_DIR)}: {png_size:,} → {len(blob):,} bytes")
+
+    print(f"\n합계: PNG {total_png:,} bytes / TCSB {total_blob:,} bytes ({total_blob / total_png:.2f}x)")
+    print(f"출력: {OUTPUT_DIR}")
+
+
+if __name__ == "__main__":
+    main()
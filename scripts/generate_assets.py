@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 """
 TypeCreature 픽셀아트 에셋 생성 스크립트
-DALL-E API를 사용하여 50종 크리처 + 5종 알 이미지 생성
+DALL-E API를 사용하여 크리처 + 5종 알 이미지 생성
 """
 
 import os
@@ -10,6 +10,8 @@ import time
 import requests
 from pathlib import Path
 
+from creature_tables import DALLE_CREATURES
+
 # OpenAI API 설정
 API_KEY = os.environ.get("OPENAI_API_KEY")
 API_URL = "https://api.openai.com/v1/images/generations"
@@ -17,66 +19,8 @@ API_URL = "https://api.openai.com/v1/images/generations"
 # 기본 스타일
 BASE_STYLE = "cute pixel art, 64x64 pixels, pastel colors, big eyes, round shape, transparent background, game asset, tamagotchi style, adorable, simple design, white background"
 
-# 크리처 목록 (이름, 프롬프트)
-CREATURES = [
-    # Legendary (3)
-    ("황금드래곤", "golden baby dragon, golden scales, small wings, sparkly, legendary aura, glowing"),
-    ("세계수정령", "tree spirit, green and brown, leaf crown, nature essence, magical particles, forest guardian"),
-    ("시간고양이", "cosmic cat, galaxy pattern fur, clock motifs, mysterious, floating stars, purple and blue"),
-
-    # Epic (7)
-    ("용아기", "baby dragon, red scales, tiny wings, breathing small flame, innocent"),
-    ("유니콘", "unicorn, white body, rainbow mane, golden horn, sparkles, magical"),
-    ("피닉스", "baby phoenix, orange and red feathers, small flames, golden eyes"),
-    ("크라켄", "baby kraken, purple tentacles, big round eyes, underwater, bubbles"),
-    ("그리폰", "baby griffin, eagle head, lion body, small wings, golden feathers"),
-    ("켈피", "water horse, blue-green colors, seaweed mane, water drops, mystical"),
-    ("바실리스크", "baby basilisk, green scales, crown pattern, yellow eyes, not scary"),
-
-    # Rare (15)
-    ("번개토끼", "electric bunny, yellow fur, lightning bolt ears, sparks"),
-    ("불꽃여우", "fire fox, orange fur, flame tail, warm colors"),
-    ("얼음펭귄", "ice penguin, blue and white, ice crystals, winter scarf"),
-    ("바람새", "wind bird, light blue feathers, wind swirls, floating"),
-    ("꽃사슴", "flower deer, brown body, flower antlers, pink blossoms"),
-    ("달토끼", "moon bunny, white fur, crescent moon, glowing, night"),
-    ("무지개뱀", "rainbow snake, colorful scales, rainbow pattern, friendly"),
-    ("구름고래", "cloud whale, white fluffy body, floating, sky blue, dreamy"),
-    ("수정나비", "crystal butterfly, transparent wings, sparkles, magical"),
-    ("숲요정", "forest fairy, green outfit, leaf wings, tiny, nature"),
-    ("별똥곰", "star bear, dark blue fur, star patterns, glowing, night sky"),
-    ("파도물개", "wave seal, blue-gray body, water splash, ocean"),
-    ("안개늑대", "mist wolf, gray fur, misty aura, mysterious, ethereal"),
-    ("노을새", "sunset bird, orange and pink feathers, warm glow, evening"),
-    ("이끼거북", "moss turtle, green shell with plants, flowers on back, garden"),
-
-    # Common (25)
-    ("슬라임", "slime, translucent green, jiggly, simple, classic"),
-    ("꼬마구름", "tiny cloud, white fluffy, floating, happy face"),
-    ("잎새", "leaf creature, green leaf body, floating"),
-    ("물방울", "water drop, blue translucent, shiny"),
-    ("돌멩이", "rock creature, gray stone, round"),
-    ("별똥별", "tiny star, yellow glowing, trail"),
-    ("꽃잎", "flower petal, pink petal body, floating"),
-    ("솜뭉치", "cotton ball, white fluffy, round, soft"),
-    ("젤리콩", "jelly bean, colorful, translucent, bouncy"),
-    ("이끼돌", "mossy rock, gray with green moss"),
-    ("눈송이", "snowflake, white crystalline, sparkling"),
-    ("반딧불", "firefly, yellow glow, tiny wings, night"),
-    ("씨앗", "seed, brown oval, tiny sprout"),
-    ("조약돌", "pebble, smooth gray, round"),
-    ("먼지토끼", "dust bunny, gray fluffy, round, floating"),
-    ("비누방울", "soap bubble, rainbow iridescent, floating"),
-    ("도토리", "acorn, brown cap, tan body"),
-    ("꿀방울", "honey drop, golden amber, shiny"),
-    ("깃털", "feather, white soft, floating"),
-    ("이슬", "dew drop, clear sparkly, on leaf"),
-    ("모래알", "sand grain, beige tiny, beach"),
-    ("풀잎", "grass blade, green simple, swaying"),
-    ("나뭇가지", "twig, brown stick, tiny leaves"),
-    ("진흙이", "mud blob, brown squishy"),
-    ("버섯", "mushroom, red cap white spots"),
-]
+# 크리처 목록 (번호, 이름, 프롬프트) - creature_catalog.json에서 생성
+CREATURES = DALLE_CREATURES
 
 # 알 목록
 EGGS = [
@@ -149,17 +93,17 @@ def main():
     print("TypeCreature 픽셀아트 생성 시작")
     print("=" * 50)
 
-    # 크리처 생성 (50개)
+    # 크리처 생성
     print(f"\n크리처 생성 중... (총 {len(CREATURES)}개)")
-    for i, (name, prompt) in enumerate(CREATURES, 1):
-        filename = f"{i}.png"
+    for num, name, prompt in CREATURES:
+        filename = f"{num}.png"
         existing = creatures_dir / filename
 
         if existing.exists():
-            print(f"[{i:02d}/50] {name} - 이미 존재함, 스킵")
+            print(f"[{num:02d}] {name} - 이미 존재함, 스킵")
             continue
 
-        print(f"[{i:02d}/50] {name} 생성 중...", end=" ", flush=True)
+        print(f"[{num:02d}] {name} 생성 중...", end=" ", flush=True)
 
         if generate_image(prompt, filename, creatures_dir):
             print("완료!")
@@ -7,18 +7,15 @@ import requests
 from pathlib import Path
 from rembg import remove
 
+from creature_tables import LEGENDARY_EGG_PROMPT
+
 API_KEY = os.environ.get("GEMINI_API_KEY")
 API_URL = "https://generativelanguage.googleapis.com/v1beta/models/imagen-4.0-fast-generate-001:predict"
 
 OUTPUT_PATH = Path(__file__).parent.parent / "TypingTamagotchi" / "Assets" / "Eggs" / "전설알.png"
 
-PROMPT = """A single egg object only, no animals no creatures,
-pixel art style egg shape, 64x64 pixels,
-BRIGHT GOLD colored egg shell, shiny metallic golden surface,
-golden crown on top of the egg, golden sparkle stars around,
-royal legendary precious egg, diamond gem decorations,
-luxury golden treasure egg, yellow gold color,
-simple game asset, white background, cute tamagotchi style"""
+# creature_catalog.json에서 생성
+PROMPT = LEGENDARY_EGG_PROMPT
 
 def main():
     if not API_KEY:
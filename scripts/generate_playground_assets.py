@@ -10,6 +10,8 @@ import requests
 from pathlib import Path
 from rembg import remove
 
+from creature_tables import PLAYGROUND_ASSETS
+
 # Gemini API 설정
 API_KEY = os.environ.get("GEMINI_API_KEY")
 API_URL = "https://generativelanguage.googleapis.com/v1beta/models/imagen-4.0-fast-generate-001:predict"
@@ -17,22 +19,8 @@ API_URL = "https://generativelanguage.googleapis.com/v1beta/models/imagen-4.0-fa
 # 경로 설정
 BASE_DIR = Path(__file__).parent.parent / "TypingTamagotchi" / "Assets" / "Playground"
 
-# 에셋 데이터
-ASSETS = [
-    (
-        "background",
-        "pixel art simple grassy field background only, 400x150 pixels wide horizontal format, "
-        "green grass texture at bottom, light blue gradient sky, small white clouds, "
-        "tiny colorful flowers in grass, NO animals, NO characters, NO creatures, "
-        "empty landscape scene, game background asset, clean minimal style"
-    ),
-    (
-        "bump_effect",
-        "cute pixel art comic impact effect, 64x64 pixels, bold text 'BUMP!' in comic style, "
-        "yellow and orange starburst explosion behind text, action lines radiating outward, "
-        "cartoon collision effect, game asset, transparent background, kawaii style"
-    ),
-]
+# 에셋 데이터 (이름, 프롬프트, 비율, 배경 제거) - creature_catalog.json에서 생성
+ASSETS = PLAYGROUND_ASSETS
 
 
 def generate_and_save(name: str, prompt: str, remove_bg: bool = False) -> bool:
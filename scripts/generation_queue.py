@@ -0,0 +1,529 @@
+#!/usr/bin/env python3
+"""
+에셋 생성 작업 큐 (SQLite)
+크리처/알/놀이터 스펙을 fetch(이미지 생성 API) → matte(rembg 배경 제거) 작업으로 나눠 큐에 넣고,
+여러 워커 프로세스 (또는 DB 파일을 공유하는 여러 머신)가 lease를 잡고 독립적으로 처리
+
+- lease: 작업을 잡은 워커만 완료/실패 처리 가능, 만료되면 다른 워커가 다시 가져감
+- heartbeat: 작업 중에는 별도 스레드가 lease를 주기적으로 연장
+- retry: 실패 시 지수 백오프 후 재시도, max_attempts 초과 시 failed
+
+사용법:
+    python generation_queue.py enqueue [--priority rarity|dirty] [--force]
+    python generation_queue.py worker fetch|matte [--drain]
+    python generation_queue.py run [--fetch-workers 2] [--matte-workers N]
+    python generation_queue.py status
+
+네트워크 드라이브로 DB를 공유할 때는 WAL이 동작하지 않으므로 기본 rollback 저널을 사용함
+"""
+
+import os
+import sys
+import json
+import time
+import uuid
+import base64
+import socket
+import sqlite3
+import hashlib
+import argparse
+import threading
+import multiprocessing
+from pathlib import Path
+from contextlib import contextmanager
+
+# Gemini API 설정
+API_KEY = os.environ.get("GEMINI_API_KEY")
+API_URL = "https://generativelanguage.googleapis.com/v1beta/models/imagen-4.0-fast-generate-001:predict"
+
+# 경로 설정
+ASSETS_DIR = Path(__file__).parent.parent / "TypingTamagotchi" / "Assets"
+DEFAULT_DB = Path(__file__).parent / "generation_queue.db"
+
+# 큐 설정
+LEASE_SECONDS = 60
+HEARTBEAT_SECONDS = 20
+POLL_SECONDS = 2
+MAX_ATTEMPTS = 3
+RETRY_BACKOFF_SECONDS = 10
+
+# 희귀도별 우선순위 (높을수록 먼저)
+RARITY_PRIORITY = {"legendary": 3, "epic": 2, "rare": 1, "common": 0}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    kind TEXT NOT NULL,                     -- fetch / matte
+    target TEXT NOT NULL,                   -- Assets 기준 상대경로
+    payload TEXT NOT NULL,                  -- JSON (prompt, aspect_ratio, matte, prompt_hash)
+    priority INTEGER NOT NULL DEFAULT 0,
+    state TEXT NOT NULL DEFAULT 'pending',  -- pending / leased / done / failed
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL,
+    available_at REAL NOT NULL,
+    lease_owner TEXT,
+    lease_expires REAL,
+    last_error TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_jobs_claim ON jobs (kind, state, priority DESC, id);
+CREATE INDEX IF NOT EXISTS idx_jobs_target ON jobs (target, state);
+
+-- 마지막으로 완성된 에셋의 프롬프트 해시 (dirty 판정용)
+CREATE TABLE IF NOT EXISTS manifest (
+    target TEXT PRIMARY KEY,
+    prompt_hash TEXT NOT NULL,
+    completed_at REAL NOT NULL
+);
+"""
+
+
+class JobQueue:
+    """SQLite 작업 큐 (커넥션은 스레드/프로세스마다 따로 열 것)"""
+
+    def __init__(self, db_path: Path):
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path, timeout=30, isolation_level=None)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA busy_timeout = 30000")
+        self.conn.executescript(SCHEMA)
+
+    @property
+    def staging_dir(self) -> Path:
+        """fetch 결과 (배경 제거 전) 임시 저장소, DB와 같은 위치에 둬서 머신 간 공유"""
+        return self.db_path.parent / "generation_staging"
+
+    def close(self):
+        self.conn.close()
+
+    @contextmanager
+    def transaction(self):
+        """쓰기 락을 먼저 잡는 트랜잭션 (다른 워커와 같은 작업을 동시에 가져가지 않도록)"""
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield self.conn
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+        self.conn.execute("COMMIT")
+
+    def enqueue(self, kind: str, target: str, payload: dict, priority: int = 0, conn=None) -> int:
+        """작업 추가 (같은 target의 진행 중 작업이 있으면 우선순위 갱신, 대기 중이면 payload도 교체)"""
+        conn = conn or self.conn
+        now = time.time()
+        row = conn.execute(
+            "SELECT id FROM jobs WHERE kind = ? AND target = ? AND state IN ('pending', 'leased')",
+            (kind, target),
+        ).fetchone()
+        if row:
+            # 프롬프트가 바뀐 경우 (dirty) 대기 중 작업이 옛 프롬프트로 생성하지 않도록 payload 교체
+            # 이미 lease된 작업은 claim 시점 payload로 끝나고, manifest 해시가 달라 다음 enqueue에서 다시 잡힘
+            conn.execute(
+                """
+                UPDATE jobs SET priority = ?, updated_at = ?,
+                                payload = CASE WHEN state = 'pending' THEN ? ELSE payload END
+                WHERE id = ?
+                """,
+                (priority, now, json.dumps(payload, ensure_ascii=False), row["id"]),
+            )
+            return row["id"]
+
+        cursor = conn.execute(
+            """
+            INSERT INTO jobs (kind, target, payload, priority, max_attempts, available_at, created_at, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (kind, target, json.dumps(payload, ensure_ascii=False), priority, MAX_ATTEMPTS, now, now, now),
+        )
+        return cursor.lastrowid
+
+    def claim(self, kind: str, owner: str):
+        """우선순위가 가장 높은 작업 하나를 lease (없으면 None)"""
+        now = time.time()
+        with self.transaction() as conn:
+            # lease가 만료됐는데 재시도 횟수를 다 쓴 작업은 실패 처리
+            conn.execute(
+                """
+                UPDATE jobs SET state = 'failed', last_error = 'lease 만료', updated_at = ?
+                WHERE state = 'leased' AND lease_expires < ? AND attempts >= max_attempts
+                """,
+                (now, now),
+            )
+            row = conn.execute(
+                """
+                SELECT * FROM jobs
+                WHERE kind = ? AND available_at <= ?
+                  AND (state = 'pending' OR (state = 'leased' AND lease_expires < ?))
+                ORDER BY priority DESC, id
+                LIMIT 1
+                """,
+                (kind, now, now),
+            ).fetchone()
+            if row is None:
+                return None
+
+            conn.execute(
+                """
+                UPDATE jobs SET state = 'leased', lease_owner = ?, lease_expires = ?,
+                                attempts = attempts + 1, updated_at = ?
+                WHERE id = ?
+                """,
+                (owner, now + LEASE_SECONDS, now, row["id"]),
+            )
+        return dict(row, attempts=row["attempts"] + 1)
+
+    def heartbeat(self, job_id: int, owner: str) -> bool:
+        """lease 연장 (다른 워커에게 넘어갔으면 False)"""
+        now = time.time()
+        cursor = self.conn.execute(
+            """
+            UPDATE jobs SET lease_expires = ?, updated_at = ?
+            WHERE id = ? AND lease_owner = ? AND state = 'leased'
+            """,
+            (now + LEASE_SECONDS, now, job_id, owner),
+        )
+        return cursor.rowcount == 1
+
+    def complete(self, job: dict, owner: str, follow_up: str | None = None) -> bool:
+        """작업 완료 처리 + 후속 작업(follow_up 종류) 추가 또는 manifest 갱신"""
+        now = time.time()
+        payload = json.loads(job["payload"])
+        with self.transaction() as conn:
+            cursor = conn.execute(
+                """
+                UPDATE jobs SET state = 'done', lease_owner = NULL, lease_expires = NULL, updated_at = ?
+                WHERE id = ? AND lease_owner = ? AND state = 'leased'
+                """,
+                (now, job["id"], owner),
+            )
+            if cursor.rowcount != 1:
+                return False
+
+            if follow_up:
+                self.enqueue(follow_up, job["target"], payload, job["priority"], conn=conn)
+            else:
+                self.record_manifest(job["target"], payload["prompt_hash"], conn=conn)
+        return True
+
+    def fail(self, job: dict, owner: str, error: str):
+        """작업 실패 처리 (재시도 가능하면 백오프 후 pending으로)"""
+        now = time.time()
+        if job["attempts"] >= job["max_attempts"]:
+            state, available_at = "failed", now
+        else:
+            state = "pending"
+            available_at = now + RETRY_BACKOFF_SECONDS * 2 ** (job["attempts"] - 1)
+
+        self.conn.execute(
+            """
+            UPDATE jobs SET state = ?, available_at = ?, last_error = ?,
+                            lease_owner = NULL, lease_expires = NULL, updated_at = ?
+            WHERE id = ? AND lease_owner = ? AND state = 'leased'
+            """,
+            (state, available_at, error[:500], now, job["id"], owner),
+        )
+
+    def has_open(self, kinds: tuple) -> bool:
+        """아직 처리할 작업이 남았는지 (pending/leased)"""
+        placeholders = ", ".join("?" * len(kinds))
+        row = self.conn.execute(
+            f"SELECT 1 FROM jobs WHERE kind IN ({placeholders}) AND state IN ('pending', 'leased') LIMIT 1",
+            kinds,
+        ).fetchone()
+        return row is not None
+
+    def manifest_hash(self, target: str) -> str | None:
+        row = self.conn.execute("SELECT prompt_hash FROM manifest WHERE target = ?", (target,)).fetchone()
+        return row["prompt_hash"] if row else None
+
+    def record_manifest(self, target: str, prompt_hash: str, conn=None):
+        conn = conn or self.conn
+        conn.execute(
+            "INSERT OR REPLACE INTO manifest (target, prompt_hash, completed_at) VALUES (?, ?, ?)",
+            (target, prompt_hash, time.time()),
+        )
+
+
+class Heartbeat(threading.Thread):
+    """작업 처리 중 lease를 주기적으로 연장하는 스레드"""
+
+    def __init__(self, db_path: Path, job_id: int, owner: str):
+        super().__init__(daemon=True)
+        self.db_path = db_path
+        self.job_id = job_id
+        self.owner = owner
+        self.lost = False
+        self._stop_event = threading.Event()
+
+    def run(self):
+        queue = JobQueue(self.db_path)
+        try:
+            while not self._stop_event.wait(HEARTBEAT_SECONDS):
+                if not queue.heartbeat(self.job_id, self.owner):
+                    self.lost = True
+                    return
+        finally:
+            queue.close()
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+
+
+# === 스펙 수집 ===
+
+def collect_specs() -> list[dict]:
+    """creature_tables.py (creature_catalog.json에서 생성)의 프롬프트로 에셋 스펙 수집"""
+    from creature_tables import (GEMINI_CREATURES, CREATURE_RARITY, GEMINI_EGGS, REGENERATE_EGGS,
+                                 LEGENDARY_EGG_PROMPT, PLAYGROUND_ASSETS, EGG_RARITY)
+
+    specs = []
+    # 번호 = 앱 DB id (Creatures/{id}.png)
+    for num, _name_kr, _name_en, prompt in GEMINI_CREATURES:
+        specs.append({"target": f"Creatures/{num}.png", "prompt": prompt,
+                      "aspect_ratio": "1:1", "matte": True, "rarity": CREATURE_RARITY[num].lower()})
+
+    egg_files = [f"{name_en}.png" for name_en, _name_kr, _prompt in GEMINI_EGGS]
+    egg_prompts = [prompt for _name_en, _name_kr, prompt in GEMINI_EGGS]
+    egg_files += [filename for filename, _prompt in REGENERATE_EGGS]
+    egg_prompts += [prompt for _filename, prompt in REGENERATE_EGGS]
+    egg_files.append("전설알.png")
+    egg_prompts.append(LEGENDARY_EGG_PROMPT)
+    for filename, prompt in zip(egg_files, egg_prompts):
+        specs.append({"target": f"Eggs/{filename}", "prompt": prompt,
+                      "aspect_ratio": "1:1", "matte": True, "rarity": EGG_RARITY[filename].lower()})
+
+    for name, prompt, aspect_ratio, matte in PLAYGROUND_ASSETS:
+        specs.append({"target": f"Playground/{name}.png", "prompt": prompt,
+                      "aspect_ratio": aspect_ratio, "matte": matte, "rarity": "common"})
+
+    return specs
+
+
+def prompt_hash(spec: dict) -> str:
+    key = f"{spec['prompt']}|{spec['aspect_ratio']}|{spec['matte']}"
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+
+
+def dirtiness(queue: JobQueue, spec: dict, assets_dir: Path) -> int:
+    """2: 파일 없음, 1: 프롬프트가 manifest와 다름, 0: 최신"""
+    if not (assets_dir / spec["target"]).exists():
+        return 2
+    if queue.manifest_hash(spec["target"]) != spec["prompt_hash"]:
+        return 1
+    return 0
+
+
+def cmd_enqueue(args):
+    queue = JobQueue(args.db)
+    specs = collect_specs()
+    added = baselined = 0
+
+    with queue.transaction() as conn:
+        for spec in specs:
+            spec["prompt_hash"] = prompt_hash(spec)
+            # 큐 이전에 만들어진 파일 (직접 고른 이미지 포함)은 현재 프롬프트로 만든 것으로 보고 기준점만 기록
+            # → 이후 프롬프트가 실제로 바뀌었을 때만 dirty
+            if queue.manifest_hash(spec["target"]) is None and (args.assets / spec["target"]).exists():
+                queue.record_manifest(spec["target"], spec["prompt_hash"], conn=conn)
+                baselined += 1
+
+            dirty = dirtiness(queue, spec, args.assets)
+            if dirty == 0 and not args.force:
+                continue
+
+            rarity = RARITY_PRIORITY[spec["rarity"]]
+            if args.priority == "dirty":
+                priority = dirty * 10 + rarity
+            else:
+                priority = rarity * 10 + dirty
+
+            payload = {key: spec[key] for key in ("prompt", "aspect_ratio", "matte", "prompt_hash")}
+            queue.enqueue("fetch", spec["target"], payload, priority, conn=conn)
+            added += 1
+
+    if baselined:
+        print(f"기존 파일 기준점 기록: {baselined}개 (manifest)")
+    print(f"큐에 추가: {added}개 (전체 스펙 {len(specs)}개, 우선순위: {args.priority})")
+    queue.close()
+
+
+# === 워커 ===
+
+def fetch_image(payload: dict) -> bytes:
+    """Imagen API로 이미지 생성 (실패 시 예외 → 재시도)"""
+    import requests
+
+    headers = {
+        "x-goog-api-key": API_KEY,
+        "Content-Type": "application/json"
+    }
+    data = {
+        "instances": [{"prompt": payload["prompt"]}],
+        "parameters": {"sampleCount": 1, "aspectRatio": payload["aspect_ratio"]}
+    }
+
+    response = requests.post(API_URL, headers=headers, json=data, timeout=120)
+    if response.status_code != 200:
+        raise RuntimeError(f"API 에러 ({response.status_code}): {response.text[:200]}")
+
+    predictions = response.json().get("predictions")
+    img_b64 = predictions[0].get("bytesBase64Encoded") if predictions else None
+    if not img_b64:
+        raise RuntimeError("이미지 데이터 없음")
+
+    return base64.b64decode(img_b64)
+
+
+def run_fetch(queue: JobQueue, job: dict, assets_dir: Path):
+    """fetch 작업: 배경 제거가 필요하면 staging에, 아니면 바로 Assets에 저장"""
+    payload = json.loads(job["payload"])
+    raw_img = fetch_image(payload)
+
+    if payload["matte"]:
+        output_path = queue.staging_dir / job["target"]
+        follow_up = "matte"
+    else:
+        output_path = assets_dir / job["target"]
+        follow_up = None
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_path, "wb") as f:
+        f.write(raw_img)
+    return follow_up
+
+
+def run_matte(queue: JobQueue, job: dict, assets_dir: Path):
+    """matte 작업: staging 이미지 배경 제거 후 Assets에 저장"""
+    from rembg import remove
+
+    staging_path = queue.staging_dir / job["target"]
+    transparent_img = remove(staging_path.read_bytes())
+
+    output_path = assets_dir / job["target"]
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_path, "wb") as f:
+        f.write(transparent_img)
+
+    staging_path.unlink()
+    return None
+
+
+HANDLERS = {"fetch": run_fetch, "matte": run_matte}
+
+# 이 종류의 작업을 새로 만들어낼 수 있는 작업 종류 (drain 판정용)
+UPSTREAM = {"fetch": ("fetch",), "matte": ("fetch", "matte")}
+
+
+def worker_loop(kind: str, db_path: Path, assets_dir: Path, drain: bool = False):
+    """작업을 하나씩 lease해서 처리, drain이면 남은 작업이 없을 때 종료"""
+    owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+    queue = JobQueue(db_path)
+    handler = HANDLERS[kind]
+    print(f"[{kind} {owner}] 시작")
+
+    try:
+        while True:
+            job = queue.claim(kind, owner)
+            if job is None:
+                if drain and not queue.has_open(UPSTREAM[kind]):
+                    break
+                time.sleep(POLL_SECONDS)
+                continue
+
+            print(f"[{kind} {owner}] #{job['id']} {job['target']} (시도 {job['attempts']})")
+            heartbeat = Heartbeat(db_path, job["id"], owner)
+            heartbeat.start()
+            try:
+                follow_up = handler(queue, job, assets_dir)
+            except Exception as e:
+                heartbeat.stop()
+                queue.fail(job, owner, str(e))
+                print(f"  ❌ #{job['id']} 에러: {e}")
+                continue
+
+            heartbeat.stop()
+            if heartbeat.lost or not queue.complete(job, owner, follow_up):
+                print(f"  ⚠️ #{job['id']} lease를 잃어 결과를 기록하지 않음")
+            else:
+                print(f"  ✅ #{job['id']} 완료")
+    finally:
+        queue.close()
+    print(f"[{kind} {owner}] 종료")
+
+
+def cmd_worker(args):
+    if args.kind == "fetch" and not API_KEY:
+        print("GEMINI_API_KEY 환경변수를 설정하세요")
+        sys.exit(1)
+    worker_loop(args.kind, args.db, args.assets, args.drain)
+
+
+def cmd_run(args):
+    """로컬에서 fetch/matte 워커 프로세스를 함께 띄우고 큐가 빌 때까지 대기"""
+    if args.fetch_workers and not API_KEY:
+        print("GEMINI_API_KEY 환경변수를 설정하세요")
+        sys.exit(1)
+
+    processes = []
+    for kind, count in (("fetch", args.fetch_workers), ("matte", args.matte_workers)):
+        for _ in range(count):
+            process = multiprocessing.Process(target=worker_loop, args=(kind, args.db, args.assets, True))
+            process.start()
+            processes.append(process)
+
+    for process in processes:
+        process.join()
+    cmd_status(args)
+
+
+def cmd_status(args):
+    queue = JobQueue(args.db)
+    rows = queue.conn.execute(
+        "SELECT kind, state, COUNT(*) AS n FROM jobs GROUP BY kind, state ORDER BY kind, state"
+    ).fetchall()
+
+    print("=== 작업 큐 상태 ===")
+    for row in rows:
+        print(f"  {row['kind']:<6} {row['state']:<8} {row['n']}")
+
+    failed = queue.conn.execute(
+        "SELECT id, kind, target, last_error FROM jobs WHERE state = 'failed' ORDER BY id"
+    ).fetchall()
+    for row in failed:
+        print(f"  ❌ #{row['id']} {row['kind']} {row['target']}: {row['last_error']}")
+    queue.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="에셋 생성 작업 큐")
+    parser.add_argument("--db", type=Path, default=DEFAULT_DB, help="큐 DB 경로 (머신 간 공유 가능)")
+    parser.add_argument("--assets", type=Path, default=ASSETS_DIR, help="Assets 폴더 경로")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    enqueue = sub.add_parser("enqueue", help="스크립트 테이블의 스펙을 큐에 추가")
+    enqueue.add_argument("--priority", choices=["rarity", "dirty"], default="rarity")
+    enqueue.add_argument("--force", action="store_true", help="최신 에셋도 다시 생성")
+    enqueue.set_defaults(func=cmd_enqueue)
+
+    worker = sub.add_parser("worker", help="워커 하나 실행")
+    worker.add_argument("kind", choices=sorted(HANDLERS))
+    worker.add_argument("--drain", action="store_true", help="남은 작업이 없으면 종료")
+    worker.set_defaults(func=cmd_worker)
+
+    run = sub.add_parser("run", help="로컬 워커 여러 개 실행")
+    run.add_argument("--fetch-workers", type=int, default=2)
+    run.add_argument("--matte-workers", type=int, default=os.cpu_count() or 1)
+    run.set_defaults(func=cmd_run)
+
+    status = sub.add_parser("status", help="큐 상태 출력")
+    status.set_defaults(func=cmd_status)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -8,31 +8,15 @@ import time
 from pathlib import Path
 from rembg import remove
 
+from creature_tables import REGENERATE_EGGS
+
 API_KEY = os.environ.get("GEMINI_API_KEY")
 API_URL = "https://generativelanguage.googleapis.com/v1beta/models/imagen-4.0-fast-generate-001:predict"
 
 OUTPUT_DIR = Path(__file__).parent.parent / "TypingTamagotchi" / "Assets" / "Eggs"
 
-# 알 데이터: (파일명, 프롬프트)
-EGGS = [
-    ("불꽃알.png", """A single egg object only, no animals no creatures,
-pixel art style egg shape, 64x64 pixels,
-orange and red colored egg shell with flame pattern decorations,
-fire element theme egg, warm colors,
-simple game asset, white background, cute tamagotchi style"""),
-
-    ("물방울알.png", """A single egg object only, no animals no creatures,
-pixel art style egg shape, 64x64 pixels,
-blue colored egg shell with water bubble pattern decorations,
-water element theme egg, ocean blue colors,
-simple game asset, white background, cute tamagotchi style"""),
-
-    ("바람알.png", """A single egg object only, no animals no creatures,
-pixel art style egg shape, 64x64 pixels,
-light green colored egg shell with swirl wind pattern decorations,
-wind element theme egg, mint green colors,
-simple game asset, white background, cute tamagotchi style"""),
-]
+# 알 데이터: (파일명, 프롬프트) - creature_catalog.json에서 생성
+EGGS = REGENERATE_EGGS
 
 def generate_egg(filename: str, prompt: str) -> bool:
     """단일 알 이미지 생성"""
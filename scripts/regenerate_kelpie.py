@@ -1,16 +1,19 @@
 #!/usr/bin/env python3
-"""켈피(46번) 이미지 재생성 - 뒷다리 대신 물고기 꼬리"""
+"""켈피 이미지 재생성 - 뒷다리 대신 물고기 꼬리"""
 
 import os
 import requests
 from pathlib import Path
 
+from creature_tables import GEMINI_CREATURES
+
 API_KEY = os.environ.get("OPENAI_API_KEY")
 API_URL = "https://api.openai.com/v1/images/generations"
 
 BASE_STYLE = "cute pixel art, 64x64 pixels, pastel colors, big eyes, round shape, transparent background, game asset, tamagotchi style, adorable, simple design, white background"
 
 # 켈피: 앞다리 + 물고기 꼬리 (뒷다리 없음)
+KELPIE_ID = next(num for num, _, name_en, _ in GEMINI_CREATURES if name_en == "kelpie")
 KELPIE_PROMPT = "kelpie water horse, front legs only, fish tail instead of back legs, mermaid horse, blue-green colors, seaweed mane, water drops, mystical, hippocampus style, no hind legs"
 
 def main():
@@ -18,7 +21,7 @@ def main():
         print("OPENAI_API_KEY 환경변수를 설정해주세요")
         return
 
-    output_path = Path(__file__).parent.parent / "TypingTamagotchi" / "Assets" / "Creatures" / "46.png"
+    output_path = Path(__file__).parent.parent / "TypingTamagotchi" / "Assets" / "Creatures" / f"{KELPIE_ID}.png"
 
     # 백업
     if output_path.exists():
@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+데스크톱 펫 애니메이션 스트립 사전 렌더링 (scripts/pet_strips/)
+DesktopPetViewModel이 매 프레임 계산하는 바운스/좌우 반전을 미리 프레임으로 구워서
+앱은 현재 프레임을 고정 배율로 그대로 그리기만 하면 됨
+
+    idle   Idle 상태와 동일: Y + sin(frame) * 2, 한 주기
+    walk   Walking 상태와 동일: Y + |sin(frame * 4)| * 5 (화면 아래 방향), 회전 없음, 바운스 한 번
+    bump   새 디자인 - 놀이터 Squash()와 같은 0.4초 동안 납작해졌다가 살짝 튕기며 복구
+           (놀이터는 ScaleY 0.8 고정 후 복귀만 함)
+
+프레임 시간은 DesktopPetManager의 AnimationFrame 속도 (초당 8)에서 계산하고,
+프레임 하나가 로직 틱(TICK_MS)보다 짧아 보이지 않는 프레임이 생기지 않도록 프레임 수를 제한
+
+크리처마다 시트 한 장 ({id}.png): 행 = 방향 (right, left), 열 = 애니메이션 프레임을 이어 붙임
+    [idle 0..n | walk 0..n | bump 0..n]  - 애니메이션별 시작 열은 strips.json
+프레임은 표시 1px당 SCALE px (64px 펫 창 기준 2배, HiDPI)로 모든 크리처가 같은 배율
+
+변환은 원본 해상도 스프라이트에서 발 위치(trim_sprites.anchors) 기준 아핀 역변환 + 쌍선형 보간,
+SUPERSAMPLE 배로 샘플링한 뒤 박스 축소
+내용이 캔버스 끝까지 닿는 스프라이트도 잘리지 않도록 캔버스 사방에 margin(표시 px, 정수)을 두고 샘플링
+→ 프레임 크기 = SCALE * (64 + 2 * margin), 펫 창 기준 (-margin, -margin) 위치에 그림
+
+Assets/** 는 통째로 앱에 임베드되므로 앱이 시트를 읽기 전까지는 Assets 밖에 저장 (gitignore)
+
+사용법: python render_pet_strips.py [크리처 id ...]
+"""
+
+import sys
+import json
+import math
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+from compile_catalog import ASSETS_DIR, load_catalog
+from build_placeholder_index import alpha_bbox
+from trim_sprites import anchors
+
+OUTPUT_DIR = Path(__file__).parent / "pet_strips"
+
+SCALE = 2             # 표시 1px당 출력 px (64px 펫 창의 2배, HiDPI)
+SUPERSAMPLE = 4
+DISPLAY_SIZE = 64     # DesktopPetService.PetSize - 아래 오프셋(px)의 기준
+FRAME_RATE = 8        # DesktopPetManager: AnimationFrame += deltaTime * 8
+TICK_MS = 33          # DesktopPetManager 타이머 간격 - 프레임 하나는 이보다 짧으면 안 됨
+
+# 애니메이션 정의: 프레임 수, 한 주기 길이(ms), 반복 여부, 프레임별 변환 함수 (t = 0~1 주기 위치)
+# 변환 = (dx, dy, 회전(도), scale_x, scale_y), dx/dy는 DISPLAY_SIZE 기준 px (아래쪽이 +, 앱 좌표와 같음)
+
+
+def idle_frame(t: float) -> tuple:
+    # DesktopPetViewModel Idle: sin(frame) * 2
+    return 0.0, math.sin(t * 2 * math.pi) * 2, 0.0, 1.0, 1.0
+
+
+def walk_frame(t: float) -> tuple:
+    # DesktopPetViewModel Walking: |sin(frame * 4)| * 5 - 한 주기 = 바운스 한 번
+    return 0.0, abs(math.sin(t * math.pi)) * 5, 0.0, 1.0, 1.0
+
+
+def bump_frame(t: float) -> tuple:
+    # 납작해졌다가 살짝 튕기며 복구
+    squash = 1 - 0.4 * math.exp(-4 * t) * math.cos(t * 2.5 * math.pi)
+    return 0.0, 0.0, 0.0, 1 + (1 - squash) * 0.75, squash
+
+
+def frame_count(period_ms: float, wanted: int) -> int:
+    """wanted 이하에서 프레임 하나가 TICK_MS 이상이 되는 최대 프레임 수"""
+    return max(1, min(wanted, int(period_ms // TICK_MS)))
+
+
+def animation(period_ms: float, wanted: int, loop: bool, transform) -> dict:
+    return {"frames": frame_count(period_ms, wanted), "period_ms": period_ms, "loop": loop, "transform": transform}
+
+
+DIRECTIONS = ("right", "left")  # 시트 행 순서
+
+ANIMATIONS = {
+    # sin(frame) 한 주기 = 2π / FRAME_RATE 초 (~785ms) → 8프레임 (~98ms)
+    "idle": animation(2 * math.pi / FRAME_RATE * 1000, 8, True, idle_frame),
+    # |sin(frame * 4)| 한 주기 = π / 4 / FRAME_RATE 초 (~98ms, 로직 틱 3번 정도) → 2프레임 (~49ms)
+    "walk": animation(math.pi / 4 / FRAME_RATE * 1000, 8, True, walk_frame),
+    # PlaygroundCreature.Squash(): RecoveryTimer = 0.4 → 8프레임 (50ms)
+    "bump": animation(400, 8, False, bump_frame),
+}
+
+
+def frame_durations(spec: dict) -> list[int]:
+    """한 주기를 프레임 수로 나눈 정수 ms 목록 (합이 주기와 같도록 반올림 오차 분배)"""
+    count = spec["frames"]
+    edges = [round(spec["period_ms"] * i / count) for i in range(count + 1)]
+    return [end - start for start, end in zip(edges, edges[1:])]
+
+
+def frame_params(spec: dict) -> np.ndarray:
+    """(F, 5) 프레임별 변환"""
+    count = spec["frames"]
+    return np.array([spec["transform"](i / count) for i in range(count)], dtype=np.float32)
+
+
+def required_margin(bbox: tuple, foot: tuple, unit: float, canvas: tuple) -> int:
+    """모든 애니메이션 프레임에서 내용 bbox가 캔버스 밖으로 나가는 최대 거리 (표시 px, 올림)"""
+    x, y, w, h = bbox
+    corners = np.array([[x, y], [x + w, y], [x, y + h], [x + w, y + h]], dtype=np.float64) - foot
+    width, height = canvas
+
+    overflow = 0.0
+    for spec in ANIMATIONS.values():
+        for dx, dy, angle, sx, sy in frame_params(spec):
+            theta = math.radians(angle)
+            cos, sin = math.cos(theta), math.sin(theta)
+            px = corners[:, 0] * sx
+            py = corners[:, 1] * sy
+            tx = cos * px - sin * py + foot[0] + dx * unit
+            ty = sin * px + cos * py + foot[1] + dy * unit
+            overflow = max(overflow, -tx.min(), -ty.min(), tx.max() - width, ty.max() - height)
+    return math.ceil(overflow / unit) if overflow > 0 else 0
+
+
+def premultiply(rgba: np.ndarray) -> np.ndarray:
+    """uint8 RGBA → premultiplied float32 (가장자리 어두워짐 방지)"""
+    out = rgba.astype(np.float32) / 255.0
+    out[..., :3] *= out[..., 3:4]
+    return out
+
+
+def unpremultiply(premul: np.ndarray) -> np.ndarray:
+    alpha = premul[..., 3:4]
+    rgb = np.divide(premul[..., :3], alpha, out=np.zeros_like(premul[..., :3]), where=alpha > 1e-6)
+    return (np.clip(np.concatenate([rgb, alpha], axis=-1), 0, 1) * 255 + 0.5).astype(np.uint8)
+
+
+def sample_bilinear(image: np.ndarray, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+    """image (H, W, 4)에서 (…) 모양 좌표를 쌍선형 보간, 범위 밖은 투명"""
+    height, width = image.shape[:2]
+    x0 = np.floor(xs).astype(np.int64)
+    y0 = np.floor(ys).astype(np.int64)
+    fx = (xs - x0)[..., None]
+    fy = (ys - y0)[..., None]
+
+    def pick(yy, xx):
+        inside = (xx >= 0) & (xx < width) & (yy >= 0) & (yy < height)
+        values = image[np.clip(yy, 0, height - 1), np.clip(xx, 0, width - 1)]
+        return values * inside[..., None]
+
+    top = pick(y0, x0) * (1 - fx) + pick(y0, x0 + 1) * fx
+    bottom = pick(y0 + 1, x0) * (1 - fx) + pick(y0 + 1, x0 + 1) * fx
+    return top * (1 - fy) + bottom * fy
+
+
+def render_animation(premul: np.ndarray, foot: tuple, spec: dict, margin: int) -> np.ndarray:
+    """모든 프레임을 한 번에 역변환 → (F, size, size, 4) premultiplied
+    출력 프레임은 캔버스를 사방으로 margin(표시 px)만큼 넓힌 영역, size = SCALE * (DISPLAY_SIZE + 2 * margin)"""
+    height, width = premul.shape[:2]
+    count = spec["frames"]
+    size = SCALE * (DISPLAY_SIZE + 2 * margin)
+    grid = size * SUPERSAMPLE
+    unit = width / DISPLAY_SIZE  # 표시 px → 캔버스 px
+    pad = margin * unit
+
+    params = frame_params(spec)
+    dx, dy, angle, sx, sy = (params[:, i, None, None] for i in range(5))
+    theta = np.radians(angle)
+
+    # 출력 픽셀 중심 → 캔버스 좌표
+    samples = np.arange(grid, dtype=np.float32) + 0.5
+    out_x, out_y = np.meshgrid(
+        samples * ((width + 2 * pad) / grid) - pad,
+        samples * ((height + 2 * pad) / grid) - pad,
+    )
+
+    # 순변환 p' = foot + d + R·S·(p - foot) 의 역변환
+    fx, fy = foot
+    rx = out_x[None] - fx - dx * unit
+    ry = out_y[None] - fy - dy * unit
+    cos, sin = np.cos(theta), np.sin(theta)
+    src_x = (cos * rx + sin * ry) / sx + fx - 0.5
+    src_y = (-sin * rx + cos * ry) / sy + fy - 0.5
+
+    frames = sample_bilinear(premul, src_x, src_y)
+    # SUPERSAMPLE x SUPERSAMPLE 박스 평균으로 축소
+    frames = frames.reshape(count, size, SUPERSAMPLE, size, SUPERSAMPLE, 4).mean(axis=(2, 4))
+    return frames
+
+
+def animation_columns() -> dict[str, int]:
+    """애니메이션별 시트 시작 열"""
+    columns = {}
+    start = 0
+    for name, spec in ANIMATIONS.items():
+        columns[name] = start
+        start += spec["frames"]
+    return columns
+
+
+def render_sheet(creature: dict) -> tuple[Image.Image, int]:
+    """크리처 하나 → (시트 이미지, 여백(표시 px))"""
+    with Image.open(ASSETS_DIR / creature["sprite"]) as img:
+        rgba = np.asarray(img.convert("RGBA"))
+
+    bbox = alpha_bbox(rgba[..., 3])
+    if bbox is None:
+        raise ValueError("완전 투명한 스프라이트")
+    x, y, w, h = bbox
+    foot, _center = anchors(rgba[y:y + h, x:x + w, 3])
+    foot = (foot[0] + x, foot[1] + y)
+    unit = rgba.shape[1] / DISPLAY_SIZE
+    margin = required_margin(bbox, foot, unit, (rgba.shape[1], rgba.shape[0]))
+
+    premul = premultiply(rgba)
+    size = SCALE * (DISPLAY_SIZE + 2 * margin)
+    columns = sum(spec["frames"] for spec in ANIMATIONS.values())
+    sheet = np.zeros((len(DIRECTIONS) * size, columns * size, 4), dtype=np.uint8)
+
+    # 원본이 왼쪽을 보면 그대로가 left, 나머지(정면 포함)는 그대로를 right로 사용
+    native = "left" if creature.get("facing") == "left" else "right"
+    starts = animation_columns()
+    for name, spec in ANIMATIONS.items():
+        frames = unpremultiply(render_animation(premul, foot, spec, margin))
+        flipped = frames[:, :, ::-1]
+        for row, direction in enumerate(DIRECTIONS):
+            strip = frames if direction == native else flipped
+            for i, frame in enumerate(strip):
+                column = starts[name] + i
+                sheet[row * size:(row + 1) * size, column * size:(column + 1) * size] = frame
+
+    return Image.fromarray(sheet, "RGBA"), margin
+
+
+def main():
+    targets = {int(arg) for arg in sys.argv[1:]}
+    creatures = [c for c in load_catalog() if not targets or c["id"] in targets]
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+
+    print(f"=== 펫 애니메이션 스트립 렌더링 ({len(creatures)}종) ===\n")
+
+    metadata_path = OUTPUT_DIR / "strips.json"
+    if metadata_path.exists():
+        with open(metadata_path, encoding="utf-8") as f:
+            sheets = json.load(f).get("creatures", {})
+    else:
+        sheets = {}
+
+    for creature in creatures:
+        try:
+            sheet, margin = render_sheet(creature)
+        except Exception as e:
+            print(f"  ❌ [{creature['id']}] {creature['name']}: {e}")
+            continue
+
+        sheet_path = OUTPUT_DIR / f"{creature['id']}.png"
+        sheet.save(sheet_path, optimize=True)
+        size = SCALE * (DISPLAY_SIZE + 2 * margin)
+        sheets[str(creature["id"])] = {"sheet": sheet_path.name, "margin": margin, "frame_size": size}
+        print(f"  ✅ [{creature['id']}] {creature['name']} (여백 {margin}px, 프레임 {size}px, "
+              f"{sheet_path.stat().st_size:,} bytes)")
+
+    starts = animation_columns()
+    metadata = {
+        "scale": SCALE,
+        "display_size": DISPLAY_SIZE,
+        "rows": {direction: row for row, direction in enumerate(DIRECTIONS)},
+        "animations": {
+            name: {
+                "column": starts[name],
+                "frames": spec["frames"],
+                "frame_durations_ms": frame_durations(spec),
+                "loop": spec["loop"],
+            }
+            for name, spec in ANIMATIONS.items()
+        },
+        "creatures": dict(sorted(sheets.items(), key=lambda item: int(item[0]))),
+    }
+    with open(metadata_path, "w", encoding="utf-8") as f:
+        json.dump(metadata, f, ensure_ascii=False, indent=2)
+
+    print(f"\n완료! {OUTPUT_DIR}")
+
+
+if __name__ == "__main__":
+    main()
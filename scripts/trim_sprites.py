@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+스프라이트 투명 여백 자르기 + 앵커 메타데이터
+배경 제거된 크리처 PNG는 1024x1024 캔버스 중 일부만 내용이 있으므로
+알파 기준 영역 + 패딩만 남기고, 원래 캔버스 안에서의 위치와 앵커를 trim.json에 기록
+
+    canvas   원본 캔버스 크기 [w, h]
+    offset   잘라낸 이미지의 캔버스 내 좌상단 [x, y]
+    size     잘라낸 이미지 크기 [w, h]
+    foot     발 위치 (잘라낸 이미지 기준) - 내용 하단 줄 불투명 픽셀의 가로 중심
+    center   알파 가중 무게중심 (잘라낸 이미지 기준)
+
+앱에서는 캔버스 좌표 = offset + 앵커 로 바꾸면 기존 64x64 박스 기준 위치 계산
+(DesktopPetService 바닥 고정, 놀이터 충돌 박스)을 그대로 유지할 수 있음
+
+출력은 scripts/trimmed/<폴더명>/ (Assets/** 는 통째로 앱에 임베드되므로 Assets 밖에 둠)
+
+사용법: python trim_sprites.py [폴더명=Creatures] [--padding 4]
+"""
+
+import json
+import argparse
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+from build_placeholder_index import ASSETS_DIR, ALPHA_THRESHOLD, alpha_bbox
+
+OUTPUT_ROOT = Path(__file__).parent / "trimmed"
+
+DEFAULT_PADDING = 4
+FOOT_BAND = 0.05  # 내용 높이 중 하단 몇 %를 발로 볼지
+
+
+def trim_box(bbox: tuple, canvas: tuple, padding: int) -> tuple[int, int, int, int]:
+    """bbox [x, y, w, h]에 패딩을 더하고 캔버스 안으로 자른 (left, top, right, bottom)"""
+    x, y, w, h = bbox
+    width, height = canvas
+    return (
+        max(0, x - padding),
+        max(0, y - padding),
+        min(width, x + w + padding),
+        min(height, y + h + padding),
+    )
+
+
+def anchors(alpha: np.ndarray) -> tuple[list[float], list[float]]:
+    """잘라낸 알파 (H, W) → foot, center 앵커 (픽셀 좌표)"""
+    weights = alpha.astype(np.float64)
+    weights[alpha <= ALPHA_THRESHOLD] = 0
+    ys, xs = np.indices(alpha.shape)
+    total = weights.sum()
+    center = [float((xs * weights).sum() / total), float((ys * weights).sum() / total)]
+
+    rows = np.flatnonzero((alpha > ALPHA_THRESHOLD).any(axis=1))
+    top, bottom = rows[0], rows[-1]
+    band_top = bottom - max(1, int((bottom - top + 1) * FOOT_BAND)) + 1
+    band = weights[band_top:bottom + 1]
+    foot_x = (band.sum(axis=0) * np.arange(alpha.shape[1])).sum() / band.sum()
+    foot = [float(foot_x), float(bottom + 1)]
+
+    return [round(v, 1) for v in foot], [round(v, 1) for v in center]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="스프라이트 투명 여백 자르기")
+    parser.add_argument("folder", nargs="?", default="Creatures", help="Assets 아래 폴더명")
+    parser.add_argument("--padding", type=int, default=DEFAULT_PADDING, help="내용 주변에 남길 여백 (px)")
+    args = parser.parse_args()
+
+    source_dir = ASSETS_DIR / args.folder
+    output_dir = OUTPUT_ROOT / args.folder
+    png_paths = sorted(source_dir.glob("*.png"))
+
+    if not png_paths:
+        print(f"PNG 없음: {source_dir}")
+        return
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    print(f"=== 여백 자르기 ({len(png_paths)}개, 패딩 {args.padding}px) ===\n")
+
+    metadata = {}
+    pixels_before = pixels_after = 0
+    bytes_before = bytes_after = 0
+
+    for png_path in png_paths:
+        with Image.open(png_path) as img:
+            rgba = img.convert("RGBA")
+        pixels = np.asarray(rgba)
+        canvas = (rgba.width, rgba.height)
+
+        bbox = alpha_bbox(pixels[..., 3])
+        if bbox is None:
+            print(f"  ⚠️ {png_path.name}: 완전 투명, 스킵")
+            continue
+
+        left, top, right, bottom = trim_box(bbox, canvas, args.padding)
+        cropped = pixels[top:bottom, left:right]
+        foot, center = anchors(cropped[..., 3])
+
+        output_path = output_dir / png_path.name
+        Image.fromarray(cropped, "RGBA").save(output_path, optimize=True)
+
+        metadata[png_path.name] = {
+            "canvas": list(canvas),
+            "offset": [left, top],
+            "size": [right - left, bottom - top],
+            "foot": foot,
+            "center": center,
+        }
+
+        before, after = canvas[0] * canvas[1], (right - left) * (bottom - top)
+        pixels_before += before
+        pixels_after += after
+        bytes_before += png_path.stat().st_size
+        bytes_after += output_path.stat().st_size
+        print(f"  {png_path.name}: {canvas[0]}x{canvas[1]} → {right - left}x{bottom - top} "
+              f"({after / before:.0%})")
+
+    with open(output_dir / "trim.json", "w", encoding="utf-8") as f:
+        json.dump({"padding": args.padding, "sprites": metadata}, f, ensure_ascii=False, indent=2)
+
+    if not metadata:
+        print("\n잘라낸 스프라이트 없음")
+        return
+
+    print("\n" + "=" * 50)
+    print(f"픽셀: {pixels_before:,} → {pixels_after:,} ({pixels_before - pixels_after:,} 절약, "
+          f"{1 - pixels_after / pixels_before:.0%})")
+    print(f"용량: {bytes_before:,} → {bytes_after:,} bytes ({bytes_before - bytes_after:,} 절약, "
+          f"{1 - bytes_after / bytes_before:.0%})")
+    print(f"메타데이터: {output_dir / 'trim.json'}")
+    print("=" * 50)
+
+
+if __name__ == "__main__":
+    main()